@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import List
-from datetime import datetime, timedelta, time
+from datetime import datetime, timedelta, timezone, time
 
 from app.db.database import get_db
 from app.db import models
@@ -12,10 +12,11 @@ from app.utils.sequence_fixer import fix_all_sequences, fix_table_sequence
 from sqlalchemy.orm import selectinload
 
 KST_OFFSET = timedelta(hours=9)
+KST = timezone(KST_OFFSET)
 
 def now_kst() -> datetime:
     """한국 시간(KST) 기준 현재 시간 반환"""
-    return datetime.utcnow() + KST_OFFSET
+    return datetime.now(KST).replace(tzinfo=None)
 
 router = APIRouter()
 
@@ -373,10 +374,8 @@ async def test_blog_collection(campaign_id: int, db: Session = Depends(get_db)):
             }
         
         from app.services.scheduler_service import SchedulerService
-        from datetime import datetime, timedelta
         
-        KST_OFFSET = timedelta(hours=9)
-        collection_date = datetime.utcnow() + KST_OFFSET
+        collection_date = now_kst()
         
         # 새로운 스케줄러 인스턴스 생성 (테스트용)
         scheduler = SchedulerService()
@@ -387,11 +386,11 @@ async def test_blog_collection(campaign_id: int, db: Session = Depends(get_db)):
                 print(f"Testing blog collection for schedule {schedule.id}: {schedule.campaign_url}")
                 
                 # 블로그 수집 실행 (private 메서드이지만 테스트를 위해 접근)
-                await scheduler._collect_campaign_blogs(schedule, campaign, collection_date)
-                scheduler.db.commit()
+                await scheduler._collect_campaign_blogs(schedule, campaign, collection_date, db)
+                db.commit()
                 
-                # 스케줄러 세션에서 수집된 데이터 확인 (commit 후)
-                blog_entry = scheduler.db.query(models.CampaignBlog).filter(
+                # 수집된 데이터 확인 (commit 후)
+                blog_entry = db.query(models.CampaignBlog).filter(
                     models.CampaignBlog.campaign_id == campaign_id,
                     models.CampaignBlog.campaign_url == schedule.campaign_url,
                     models.CampaignBlog.collection_date >= collection_date.replace(hour=0, minute=0, second=0, microsecond=0),
@@ -399,7 +398,7 @@ async def test_blog_collection(campaign_id: int, db: Session = Depends(get_db)):
                 ).first()
                 
                 if blog_entry:
-                    rankings = scheduler.db.query(models.CampaignBlogRanking).filter(
+                    rankings = db.query(models.CampaignBlogRanking).filter(
                         models.CampaignBlogRanking.campaign_blog_id == blog_entry.id
                     ).all()
                     
@@ -435,6 +434,7 @@ async def test_blog_collection(campaign_id: int, db: Session = Depends(get_db)):
                 import traceback
                 error_detail = traceback.format_exc()
                 print(f"Error testing blog collection for schedule {schedule.id}: {error_detail}")
+                db.rollback()
                 results.append({
                     "schedule_id": schedule.id,
                     "blog_url": schedule.campaign_url,
@@ -442,9 +442,6 @@ async def test_blog_collection(campaign_id: int, db: Session = Depends(get_db)):
                     "error": str(e),
                     "traceback": error_detail
                 })
-            finally:
-                # 스케줄러 세션 정리
-                scheduler.db.close()
         
         success_count = sum(1 for r in results if r.get("success", False))
         failed_count = len(results) - success_count
@@ -523,18 +520,15 @@ async def immediate_collection(campaign_id: int, db: Session = Depends(get_db)):
                 }
             
             processed_count = 0
-            try:
-                for schedule in blog_schedules:
-                    try:
-                        await scheduler._collect_campaign_blogs(schedule, campaign, collection_date)
-                        scheduler.db.commit()
-                        processed_count += 1
-                    except Exception as e:
-                        print(f"Error collecting blog for schedule {schedule.id}: {str(e)}")
-                        scheduler.db.rollback()
-                        continue
-            finally:
-                scheduler.db.close()
+            for schedule in blog_schedules:
+                try:
+                    await scheduler._collect_campaign_blogs(schedule, campaign, collection_date, db)
+                    db.commit()
+                    processed_count += 1
+                except Exception as e:
+                    print(f"Error collecting blog for schedule {schedule.id}: {str(e)}")
+                    db.rollback()
+                    continue
             
             return {
                 "message": f"{processed_count}개의 블로그 수집 작업이 완료되었습니다.",
@@ -601,7 +595,7 @@ async def immediate_collection(campaign_id: int, db: Session = Depends(get_db)):
                     else:
                         # 사용자 프로필 URL인 경우, 스케줄러를 통해 처리
                         # 하지만 오늘 날짜 체크를 우회하기 위해 직접 처리
-                        await scheduler._collect_campaign_instagram_reels(schedule, campaign, now_kst())
+                        await scheduler._collect_campaign_instagram_reels(schedule, campaign, now_kst(), db)
                     
                     processed_count += 1
                 except Exception as e:
@@ -173,9 +173,11 @@ async def _run_simple_immediate_collection(campaign_id: int) -> None:
             for schedule in schedules:
                 try:
                     logger.info(f"🔄 스케줄 처리: {schedule.campaign_url}")
-                    await scheduler._process_schedule(schedule)
+                    await scheduler._process_schedule(schedule, db)
+                    db.commit()
                 except Exception as e:
                     logger.error(f"스케줄 처리 실패 {schedule.campaign_url}: {str(e)}")
+                    db.rollback()
                     continue
             
             logger.info(f"🎉 캠페인 {campaign_id} 즉시 수집 완료")
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.orm import Session
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List
 import uuid
 
@@ -21,10 +21,11 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 KST_OFFSET = timedelta(hours=9)
+KST = timezone(KST_OFFSET)
 
 
 def now_kst() -> datetime:
-    return datetime.utcnow() + KST_OFFSET
+    return datetime.now(KST).replace(tzinfo=None)
 
 @router.post("/influencer/ingest/batch")
 async def ingest_instagram_data_batch(
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import and_
 from typing import Any, Dict, List, Optional
 from collections import defaultdict, Counter
+from datetime import datetime
 
 from app.db.database import get_db
 from app.db import models
@@ -16,41 +17,11 @@ def _calculate_influencer_grade(db: Session, username: str) -> Optional[str]:
     사용자의 등급을 계산합니다.
     24개 릴스의 평균 조회수 (최상 2개 + 최하위 2개 제외한 나머지 20개의 평균)로 계산
     """
-    # 인플루언서 프로필 조회
-    profile = db.query(models.InfluencerProfile).filter(
-        models.InfluencerProfile.username == username
-    ).first()
-    
-    if not profile:
-        return None
-    
-    # 최대 24개 릴스의 조회수 조회
-    reels = db.query(models.InfluencerReel).filter(
-        models.InfluencerReel.profile_id == profile.id,
-        models.InfluencerReel.video_play_count.isnot(None)
-    ).order_by(models.InfluencerReel.created_at.desc()).limit(24).all()
-    
-    if not reels:
-        return None
-    
-    # 조회수 추출
-    view_counts = [reel.video_play_count for reel in reels if reel.video_play_count is not None and reel.video_play_count > 0]
-    
-    if len(view_counts) == 0:
-        return None
-    
-    # 최상위 2개, 최하위 2개 제외 (20개 이상일 때만)
-    if len(view_counts) > 4:
-        view_counts_sorted = sorted(view_counts)
-        trimmed_counts = view_counts_sorted[2:-2]  # 최하위 2개, 최상위 2개 제외
-    else:
-        trimmed_counts = view_counts
-    
-    if not trimmed_counts:
+    # 최근 24개 릴스의 절삭 평균을 DB에서 한 번에 계산
+    trimmed_average = instagram_grade_service.get_recent_trimmed_average(db, username)
+    if trimmed_average is None:
         return None
-    
-    # 평균 계산
-    average_views = sum(trimmed_counts) / len(trimmed_counts)
+    average_views, _, _ = trimmed_average
     
     # instagram_grade_thresholds 테이블 기준으로 등급 반환
     grade = instagram_grade_service.get_grade_for_average(db, average_views)
@@ -58,6 +29,18 @@ def _calculate_influencer_grade(db: Session, username: str) -> Optional[str]:
     return grade
 
 
+def _parse_date_posted(value: Any) -> Optional[datetime]:
+    """BrightData date_posted(ISO 8601, 'Z' 접미사 포함 가능) 문자열을 datetime으로 변환"""
+    if not value or not isinstance(value, str):
+        return None
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
 def _get_latest_reel_view_count(db: Session, reel_id: str, profile_id: int) -> int:
     """
     특정 릴스의 최신 조회수를 반환합니다.
@@ -73,6 +56,17 @@ def _get_latest_reel_view_count(db: Session, reel_id: str, profile_id: int) -> i
     return reel.video_play_count or reel.views or 0
 
 
+def _extract_reel_id_from_url(url: Optional[str]) -> Optional[str]:
+    """릴스 URL(https://www.instagram.com/reel/{id}/...)에서 릴스 ID를 추출합니다."""
+    if not url:
+        return None
+    _, marker, rest = url.partition('/reel/')
+    if not marker:
+        return None
+    reel_id = rest.split('/', 1)[0].split('?', 1)[0]
+    return reel_id or None
+
+
 def _extract_reel_ids_from_campaign_urls(campaign_urls: List[models.CampaignURL]) -> set:
     """
     캠페인 URL에서 릴스 ID들을 추출합니다.
@@ -80,16 +74,9 @@ def _extract_reel_ids_from_campaign_urls(campaign_urls: List[models.CampaignURL]
     reel_ids = set()
     
     for campaign_url in campaign_urls:
-        try:
-            url = campaign_url.url.strip().rstrip('/')
-            if '/reel/' in url:
-                # 릴스 URL에서 릴스 ID 추출
-                parts = url.split('/reel/')
-                if len(parts) > 1:
-                    reel_id = parts[1].split('/')[0].split('?')[0]
-                    reel_ids.add(reel_id)
-        except Exception:
-            continue
+        reel_id = _extract_reel_id_from_url((campaign_url.url or '').strip())
+        if reel_id:
+            reel_ids.add(reel_id)
     
     return reel_ids
 
@@ -127,22 +114,15 @@ async def get_instagram_post_report(
         )
         
         # campaign_instagram_reels와 조인하여 추가 데이터 가져오기
-        # reel_url에서 reel_id 추출 함수
-        def extract_reel_id_from_url(url: str) -> Optional[str]:
-            try:
-                if '/reel/' in url:
-                    parts = url.split('/reel/')
-                    if len(parts) > 1:
-                        reel_id = parts[1].split('/')[0].split('?')[0]
-                        return reel_id
-            except Exception:
-                pass
-            return None
+        # reel_url에서 reel_id는 URL별로 한 번만 추출
+        reel_ids_by_url = {
+            job.reel_url: _extract_reel_id_from_url(job.reel_url) for job in collection_jobs
+        }
         
         # 각 job에 대해 campaign_instagram_reels에서 추가 데이터 조회
         reel_data_map = {}  # reel_url -> CampaignInstagramReel 데이터
         for job in collection_jobs:
-            reel_id = extract_reel_id_from_url(job.reel_url)
+            reel_id = reel_ids_by_url[job.reel_url]
             if reel_id:
                 # reel_id로 조회
                 reel_data = db.query(models.CampaignInstagramReel).filter(
@@ -170,7 +150,7 @@ async def get_instagram_post_report(
             reel_data = reel_data_map.get(job.reel_url)
             
             # reel_id 추출
-            reel_id = extract_reel_id_from_url(job.reel_url) or ""
+            reel_id = reel_ids_by_url[job.reel_url] or ""
             
             # campaign_instagram_reels에서 가져온 데이터 또는 기본값 사용
             display_name = reel_data.display_name if reel_data else None
@@ -180,14 +160,8 @@ async def get_instagram_post_report(
             grade = reel_data.grade if reel_data else None
             product = reel_data.product if reel_data else campaign.product
             posted_at = reel_data.posted_at if reel_data else None
-            if posted_at is None and job.job_metadata and isinstance(job.job_metadata, dict):
-                date_posted_str = job.job_metadata.get('date_posted')
-                if date_posted_str:
-                    try:
-                        from datetime import datetime
-                        posted_at = datetime.fromisoformat(date_posted_str.replace('Z', '+00:00'))
-                    except Exception:
-                        pass
+            if posted_at is None and isinstance(job.job_metadata, dict):
+                posted_at = _parse_date_posted(job.job_metadata.get('date_posted'))
             
             # campaign_instagram_reels에서 가져온 데이터 또는 기본값 사용
             thumbnail_url = None
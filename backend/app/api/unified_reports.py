@@ -31,41 +31,11 @@ def _calculate_influencer_grade_with_avg(db: Session, username: str) -> Optional
     사용자의 등급과 평균 조회수를 계산합니다.
     24개 릴스의 평균 조회수 (최상 2개 + 최하위 2개 제외한 나머지 20개의 평균)로 계산
     """
-    # 인플루언서 프로필 조회
-    profile = db.query(models.InfluencerProfile).filter(
-        models.InfluencerProfile.username == username
-    ).first()
-    
-    if not profile:
-        return None
-    
-    # 최대 24개 릴스의 조회수 조회
-    reels = db.query(models.InfluencerReel).filter(
-        models.InfluencerReel.profile_id == profile.id,
-        models.InfluencerReel.video_play_count.isnot(None)
-    ).order_by(models.InfluencerReel.created_at.desc()).limit(24).all()
-    
-    if not reels:
-        return None
-    
-    # 조회수 추출
-    view_counts = [reel.video_play_count for reel in reels if reel.video_play_count is not None and reel.video_play_count > 0]
-    
-    if len(view_counts) == 0:
+    # 최근 24개 릴스의 절삭 평균을 DB에서 한 번에 계산
+    trimmed_average = instagram_grade_service.get_recent_trimmed_average(db, username)
+    if trimmed_average is None:
         return None
-    
-    # 최상위 2개, 최하위 2개 제외 (20개 이상일 때만)
-    if len(view_counts) > 4:
-        view_counts_sorted = sorted(view_counts)
-        trimmed_counts = view_counts_sorted[2:-2]  # 최하위 2개, 최상위 2개 제외
-    else:
-        trimmed_counts = view_counts
-    
-    if not trimmed_counts:
-        return None
-    
-    # 평균 계산
-    average_views = sum(trimmed_counts) / len(trimmed_counts)
+    average_views, total_reels, trimmed_reels = trimmed_average
     
     # instagram_grade_thresholds 테이블 기준으로 등급 반환
     grade = instagram_grade_service.get_grade_for_average(db, average_views)
@@ -73,8 +43,8 @@ def _calculate_influencer_grade_with_avg(db: Session, username: str) -> Optional
     return {
         'grade': grade,
         'avg_views': average_views,
-        'total_reels': len(view_counts),
-        'trimmed_reels': len(trimmed_counts)
+        'total_reels': total_reels,
+        'trimmed_reels': trimmed_reels
     }
 
 
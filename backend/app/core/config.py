@@ -60,9 +60,26 @@ class Settings(BaseSettings):
     # 보고서 API는 IP 제한 없이 공개 (기본값: True)
     public_report_apis: bool = True
     
+    # Logging
+    log_level: str = "INFO"  # 스케줄러 루프의 상세 로그는 DEBUG에서만 출력
+    
+    # Scheduler
+    scheduler_concurrency: int = 8  # 동시에 처리할 수집 스케줄 수
+    # True면 스케줄 조회 시 미리 로드하지 않은 관계 접근을 오류로 처리 (N+1 쿼리 탐지용, 개발 환경 전용)
+    scheduler_raiseload: bool = False
+    
     # Storage
     storage_provider: str = "s3"  # local or s3
     
+    # Progress (SSE) backend
+    # memory: 단일 프로세스용 in-process 큐 / redis: 멀티 워커 환경에서 Redis Pub/Sub로 전달
+    progress_backend: str = "memory"
+    redis_url: str = "redis://localhost:6379/0"
+    
+    # 릴스 수집 작업 멱등성 캐시 (같은 시간대 재실행 시 BrightData 재전송 방지, redis_url 사용)
+    reel_job_cache_enabled: bool = False
+    reel_job_cache_ttl: int = 3600  # 초 (키가 시간대 단위이므로 실제 TTL은 해당 시간대가 끝날 때까지로 제한)
+    
     # SSH Tunnel (for local development to access RDS via EC2 bastion)
     # Docker 환경에서는 자동으로 False로 설정됨
     use_ssh_tunnel: bool = False
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Float, Boolean, ForeignKey, JSON, Date, UniqueConstraint
+from sqlalchemy import Column, Integer, String, DateTime, Text, Float, Boolean, ForeignKey, JSON, Date, UniqueConstraint, Index, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -48,6 +48,9 @@ class CampaignURL(Base):
 
 class CollectionSchedule(Base):
     __tablename__ = "collection_schedules"
+    __table_args__ = (
+        Index("ix_collection_schedules_active_range", "is_active", "start_date", "end_date"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     campaign_id = Column(Integer, ForeignKey("campaigns.id"), nullable=False)
@@ -122,6 +125,9 @@ class BlogRanking(Base):
 # Campaign collection tables
 class CampaignInstagramPost(Base):
     __tablename__ = "campaign_instagram_posts"
+    __table_args__ = (
+        Index("ix_campaign_instagram_posts_dedup", "campaign_id", "campaign_url", "collection_date"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     campaign_id = Column(Integer, ForeignKey("campaigns.id"), nullable=False)
@@ -143,6 +149,9 @@ class CampaignInstagramPost(Base):
 
 class CampaignInstagramReel(Base):
     __tablename__ = "campaign_instagram_reels"
+    __table_args__ = (
+        Index("ix_campaign_instagram_reels_dedup", "campaign_id", "campaign_url", "collection_date"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     campaign_id = Column(Integer, ForeignKey("campaigns.id"), nullable=False)
@@ -163,6 +172,9 @@ class CampaignInstagramReel(Base):
 
 class CampaignBlog(Base):
     __tablename__ = "campaign_blogs"
+    __table_args__ = (
+        Index("ix_campaign_blogs_dedup", "campaign_id", "campaign_url", "collection_date"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     campaign_id = Column(Integer, ForeignKey("campaigns.id"), nullable=False)
@@ -524,6 +536,15 @@ class ClassificationJob(Base):
 
 class CampaignReelCollectionJob(Base):
     __tablename__ = "campaign_reel_collection_jobs"
+    __table_args__ = (
+        Index("ix_campaign_reel_collection_jobs_campaign_status", "campaign_id", "status"),
+        # 스케줄러 '오늘 수집 완료' 확인 조건과 동일한 부분 인덱스
+        Index(
+            "ix_campaign_reel_collection_jobs_dedup",
+            "campaign_id", "reel_url", "status", "completed_at",
+            postgresql_where=text("user_posted IS NOT NULL"),
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     campaign_id = Column(Integer, ForeignKey("campaigns.id"), nullable=False)
@@ -1,3 +1,5 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from sqlalchemy import text
 
@@ -6,6 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from app.core.config import settings
+from app.core.logging_config import setup_logging
 from app.db.database import engine, SessionLocal
 from app.db import models
 from app.db.ssh_tunnel import start_ssh_tunnel, stop_ssh_tunnel
@@ -14,12 +17,16 @@ from app.services.collection_worker import start_collection_worker, stop_collect
 from app.services.classification_worker import start_classification_worker, stop_classification_worker
 from app.services.campaign_schedule_runner import start_campaign_schedule_runner, stop_campaign_schedule_runner
 from app.services.grade_service import instagram_grade_service
+from app.services.instagram_service import instagram_service
 from app.middleware.ip_whitelist import IPWhitelistMiddleware
 from app.middleware.auth_middleware import AuthMiddleware
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    setup_logging()
     print("Starting up...")
+    # asyncio.to_thread로 실행되는 S3 업로드 등 블로킹 I/O를 위한 기본 executor 확장
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=32))
     # SSH 터널 시작 (설정되어 있는 경우)
     if settings.use_ssh_tunnel:
         print("Starting SSH tunnel...")
@@ -72,6 +79,8 @@ async def lifespan(app: FastAPI):
         stop_campaign_schedule_runner()
         stop_classification_worker()
         stop_collection_worker()
+        # 공유 Instagram 클라이언트의 HTTP 세션 종료
+        await instagram_service.close()
         # SSH 터널 종료
         if settings.use_ssh_tunnel:
             print("Stopping SSH tunnel...")
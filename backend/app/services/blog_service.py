@@ -1,5 +1,4 @@
 import asyncio
-import json
 import re
 import sys
 from datetime import datetime
@@ -185,12 +184,11 @@ class BlogService:
                 return 0
 
             loop = asyncio.get_running_loop()
-            raw_json = await loop.run_in_executor(None, get_naver_blog_visitors, api_url)
-            if not raw_json:
+            data = await loop.run_in_executor(None, get_naver_blog_visitors, api_url)
+            if data is None:
                 print(f"⚠️ No response from visitor API: {api_url}")
                 return 0
 
-            data = json.loads(raw_json)
             if not isinstance(data, dict) or not data:
                 print(f"⚠️ Invalid visitor data format from API: {api_url}")
                 return 0
@@ -202,9 +200,6 @@ class BlogService:
             print(f"✅ Daily visitors collected: {visitor_count} (date: {latest_date})")
             return visitor_count
 
-        except json.JSONDecodeError as e:
-            print(f"❌ JSON decode error for daily visitors API: {str(e)}")
-            return 0
         except Exception as e:
             print(f"❌ Error getting daily visitors: {str(e)}")
             import traceback
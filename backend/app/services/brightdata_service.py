@@ -7,7 +7,7 @@ import sys
 import csv
 from pathlib import Path
 from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from .progress_service import progress_service
 from .influencer_service import InfluencerService
 from ..db.database import get_db
@@ -21,10 +21,11 @@ from instagram_api import Instagram
 logger = logging.getLogger(__name__)
 
 KST_OFFSET = timedelta(hours=9)
+KST = timezone(KST_OFFSET)
 
 
 def now_kst() -> datetime:
-    return datetime.utcnow() + KST_OFFSET
+    return datetime.now(KST).replace(tzinfo=None)
 
 class BrightDataService:
     def __init__(self, db_session=None):
@@ -49,6 +50,10 @@ class BrightDataService:
         self.snapshot_retention_days = int(os.getenv("SNAPSHOT_RETENTION_DAYS", "7"))
         self.snapshot_max_files = int(os.getenv("SNAPSHOT_MAX_FILES", "200"))  # 최대 파일 개수
         
+    async def close(self):
+        """Instagram API의 공유 HTTP 세션 종료"""
+        await self.instagram_api.close()
+
     async def collect_instagram_data_batch(self, urls: List[str], options: Dict[str, bool] = None, session_id: str = None) -> List[Dict[str, Any]]:
         """배치로 인스타그램 데이터를 수집합니다."""
         logger.info(f"🚀 BrightData 배치 수집 시작: {len(urls)}개 URL")
@@ -194,7 +199,7 @@ class BrightDataService:
                 
                 # 스냅샷 요청 (재시도 시 더 강력한 오류 처리)
                 try:
-                    snapshot_id = self.instagram_api.trigger_snapshot_request(
+                    snapshot_id = await self.instagram_api.trigger_snapshot_request(
                         dataset_id=dataset_id,
                         params=params,
                         data=input_data
@@ -215,7 +220,7 @@ class BrightDataService:
                 
                 # 스냅샷 완료 대기 (타임아웃 처리)
                 try:
-                    raw_data = self.instagram_api.wait_for_snapshot(snapshot_id, data_type)
+                    raw_data = await self.instagram_api.wait_for_snapshot(snapshot_id, data_type)
                 except Exception as wait_error:
                     logger.error(f"❌ 스냅샷 대기 실패 ({attempt+1}/{max_retries+1}): {str(wait_error)}")
                     if attempt == max_retries:
@@ -475,7 +480,7 @@ class BrightDataService:
                     params = config.get("params", {})
                     
                     # 스냅샷 요청
-                    snapshot_id = self.instagram_api.trigger_snapshot_request(
+                    snapshot_id = await self.instagram_api.trigger_snapshot_request(
                         dataset_id=dataset_id,
                         params=params,
                         data=input_params
@@ -489,7 +494,7 @@ class BrightDataService:
                     
                     # 스냅샷 완료 대기 (데이터 타입과 세션 ID 전달)
                     current_session_id = getattr(self, '_current_session_id', None)
-                    snapshot_result = self.instagram_api.wait_for_snapshot(snapshot_id, data_type, current_session_id)
+                    snapshot_result = await self.instagram_api.wait_for_snapshot(snapshot_id, data_type, current_session_id)
                     
                     if not snapshot_result:
                         logger.error(f"{data_type} 스냅샷 데이터를 받지 못함")
@@ -500,7 +505,7 @@ class BrightDataService:
                         data = snapshot_result["data"]
                         logger.info(f"📊 {data_type} 직접 데이터 수신: {len(data)}개 항목")
                     elif snapshot_result["type"] == "file_urls":
-                        data = self.instagram_api.download_snapshot_data(snapshot_result["urls"])
+                        data = await self.instagram_api.download_snapshot_data(snapshot_result["urls"])
                         logger.info(f"📥 {data_type} 파일 다운로드 완료: {len(data)}개 항목")
                     else:
                         logger.error(f"{data_type} 알 수 없는 스냅샷 결과 타입")
@@ -1,5 +1,7 @@
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
 from datetime import datetime
@@ -19,38 +21,60 @@ class CampaignReelCollectionService:
         self.api_token = os.getenv("BRIGHTDATA_API_KEY")
         self.dataset_id = "gd_lyclm20il4r5helnj"  # instagram_reels_by_url.py에서 확인한 dataset_id
         self.api_url = "https://api.brightdata.com/datasets/v3/trigger"
+        # BrightData 호출용 공유 세션 (keep-alive로 상태 확인 폴링마다 TCP/TLS 연결을 새로 맺지 않음)
+        # 일시적 오류(429/5xx)는 GET만 백오프 재시도하며, POST(수집 요청)는 중복 요청 방지를 위해 재시도하지 않음
+        self.http = requests.Session()
+        self.http.headers["Authorization"] = f"Bearer {self.api_token}"
+        self.http.mount("https://", HTTPAdapter(
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 502, 503, 504],
+                raise_on_status=False
+            )
+        ))
         
     def add_reel_collection_jobs(self, campaign_id: int, reel_urls: List[str], check_existing_data: bool = False) -> List[CampaignReelCollectionJob]:
         """캠페인의 릴스 URL들을 수집 큐에 추가"""
-        db = SessionLocal()
+        # 반환한 작업 객체를 세션 종료 후에도 읽을 수 있도록 커밋 시 만료시키지 않음 (id 등 유지)
+        db = SessionLocal(expire_on_commit=False)
         try:
             jobs = []
-            for url in reel_urls:
-                # 이미 수집 완료된 데이터가 있는지 확인 (옵션)
-                if check_existing_data:
-                    existing_completed_job = db.query(CampaignReelCollectionJob).filter(
+            # 같은 목록 안의 중복 URL은 기존 작업 조회로 걸러지지 않으므로 먼저 제거 (입력 순서 유지)
+            reel_urls = list(dict.fromkeys(reel_urls))
+            # URL별 조회 대신 기존 작업을 한 번에 조회하여 집합으로 비교
+            completed_urls = set()
+            if check_existing_data:
+                completed_urls = {
+                    reel_url for (reel_url,) in db.query(CampaignReelCollectionJob.reel_url).filter(
                         and_(
                             CampaignReelCollectionJob.campaign_id == campaign_id,
-                            CampaignReelCollectionJob.reel_url == url,
+                            CampaignReelCollectionJob.reel_url.in_(reel_urls),
                             CampaignReelCollectionJob.status == "completed",
                             CampaignReelCollectionJob.user_posted.isnot(None)
                         )
-                    ).first()
-                    
-                    if existing_completed_job:
-                        logger.info(f"Reel data already exists for {url}, skipping")
-                        continue
-                
-                # 이미 대기 중이거나 처리 중인 작업인지 확인
-                existing_job = db.query(CampaignReelCollectionJob).filter(
+                    )
+                }
+            
+            # 이미 대기 중이거나 처리 중인 작업
+            queued_urls = {
+                reel_url for (reel_url,) in db.query(CampaignReelCollectionJob.reel_url).filter(
                     and_(
                         CampaignReelCollectionJob.campaign_id == campaign_id,
-                        CampaignReelCollectionJob.reel_url == url,
+                        CampaignReelCollectionJob.reel_url.in_(reel_urls),
                         CampaignReelCollectionJob.status.in_(["pending", "processing"])
                     )
-                ).first()
+                )
+            }
+            
+            for url in reel_urls:
+                # 이미 수집 완료된 데이터가 있는지 확인 (옵션)
+                if url in completed_urls:
+                    logger.info(f"Reel data already exists for {url}, skipping")
+                    continue
                 
-                if not existing_job:
+                if url not in queued_urls:
                     job = CampaignReelCollectionJob(
                         campaign_id=campaign_id,
                         reel_url=url,
@@ -76,11 +100,6 @@ class CampaignReelCollectionService:
         if not self.api_token:
             raise ValueError("BRIGHTDATA_API_KEY not found in environment variables")
             
-        headers = {
-            "Authorization": f"Bearer {self.api_token}",
-            "Content-Type": "application/json",
-        }
-        
         params = {
             "dataset_id": self.dataset_id,
             "include_errors": "true",
@@ -90,7 +109,7 @@ class CampaignReelCollectionService:
         
         try:
             logger.info(f"Calling BrightData API for {reel_url} with dataset_id: {self.dataset_id}")
-            response = requests.post(self.api_url, headers=headers, params=params, json=data, timeout=30)
+            response = self.http.post(self.api_url, params=params, json=data, timeout=30)
             
             logger.info(f"BrightData API response status: {response.status_code}")
             response.raise_for_status()
@@ -195,29 +214,21 @@ class CampaignReelCollectionService:
     
     def _simple_snapshot_check(self, snapshot_id: str) -> int:
         """간단한 스냅샷 상태 확인 - HTTP 상태 코드만 반환"""
-        headers = {
-            "Authorization": f"Bearer {self.api_token}",
-        }
-        
         status_url = f"https://api.brightdata.com/datasets/v3/snapshot/{snapshot_id}"
         
         try:
-            response = requests.get(status_url, headers=headers, timeout=15)
+            response = self.http.get(status_url, timeout=15)
             return response.status_code
         except requests.exceptions.RequestException:
             return 500  # 네트워크 오류 등
     
     def _get_snapshot_status(self, snapshot_id: str) -> str:
         """스냅샷 상태 확인 - 새로운 BrightData API 응답 구조 대응"""
-        headers = {
-            "Authorization": f"Bearer {self.api_token}",
-        }
-        
         status_url = f"https://api.brightdata.com/datasets/v3/snapshot/{snapshot_id}"
         
         try:
             logger.info(f"Checking snapshot status: {status_url}")
-            response = requests.get(status_url, headers=headers, timeout=30)
+            response = self.http.get(status_url, timeout=30)
             
             logger.info(f"Status check response code: {response.status_code}")
             logger.info(f"Status check response text: {response.text[:500]}")
@@ -284,16 +295,12 @@ class CampaignReelCollectionService:
     
     def _fetch_and_save_reel_data(self, job_id: int, snapshot_id: str) -> bool:
         """스냅샷에서 릴스 데이터를 가져와서 저장"""
-        headers = {
-            "Authorization": f"Bearer {self.api_token}",
-        }
-        
         # 스냅샷이 ready 상태일 때만 데이터 다운로드
         data_url = f"https://api.brightdata.com/datasets/v3/snapshot/{snapshot_id}?format=json"
         
         try:
             logger.info(f"Downloading data from {data_url}")
-            response = requests.get(data_url, headers=headers, timeout=60)
+            response = self.http.get(data_url, timeout=60)
             
             logger.info(f"Data download response code: {response.status_code}")
             logger.info(f"Data download response text preview: {response.text[:500]}")
@@ -779,9 +786,9 @@ class CampaignReelCollectionService:
         """썸네일 이미지를 S3에 업로드하고 URL 반환 (동기 버전)"""
         try:
             import requests
-            import boto3
             import uuid
             from app.core.config import settings
+            from app.services.s3_service import ALLOWED_IMAGE_EXTENSIONS, get_s3_client
             
             # 이미지 다운로드
             response = requests.get(thumbnail_url, timeout=30)
@@ -789,17 +796,12 @@ class CampaignReelCollectionService:
                 logger.error(f"❌ Failed to download thumbnail: HTTP {response.status_code}")
                 return None
             
-            # S3 클라이언트 초기화
-            s3_client = boto3.client(
-                's3',
-                aws_access_key_id=settings.s3_access_key_id,
-                aws_secret_access_key=settings.s3_secret_access_key,
-                region_name=settings.s3_region
-            )
+            # 공유 S3 클라이언트 사용 (커넥션 풀 재사용)
+            s3_client = get_s3_client()
             
             # 파일 확장자 추출
             file_extension = thumbnail_url.split('.')[-1].split('?')[0]
-            if file_extension not in ['jpg', 'jpeg', 'png', 'gif']:
+            if file_extension not in ALLOWED_IMAGE_EXTENSIONS:
                 file_extension = 'jpg'
             
             # S3 키 생성
@@ -1,18 +1,21 @@
 import asyncio
 import logging
 import threading
-from datetime import datetime, timedelta, date
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone, date
 from typing import Optional
 
+from app.services.instagram_service import instagram_service
 from app.services.scheduler_service import SchedulerService
 
 logger = logging.getLogger(__name__)
 
 KST_OFFSET = timedelta(hours=9)
+KST = timezone(KST_OFFSET)
 
 
 def now_kst() -> datetime:
-    return datetime.utcnow() + KST_OFFSET
+    return datetime.now(KST).replace(tzinfo=None)
 
 
 class CampaignScheduleRunner:
@@ -28,13 +31,19 @@ class CampaignScheduleRunner:
 
         self.is_running = True
         logger.info("🗓️ 캠페인 스케줄러 시작")
+        # 별도 스레드의 이벤트 루프이므로 썸네일 업로드용 기본 executor를 여기서 설정
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=32))
 
-        while self.is_running:
-            try:
-                await self._run_if_needed()
-            except Exception as exc:  # noqa: BLE001
-                logger.error("캠페인 스케줄러 실행 오류: %s", exc)
-            await asyncio.sleep(3600)  # 1시간마다 확인
+        try:
+            while self.is_running:
+                try:
+                    await self._run_if_needed()
+                except Exception as exc:  # noqa: BLE001
+                    logger.error("캠페인 스케줄러 실행 오류: %s", exc)
+                await asyncio.sleep(3600)  # 1시간마다 확인
+        finally:
+            # 이 스레드의 이벤트 루프에서 만든 Instagram HTTP 세션은 루프가 끝나기 전에 닫음
+            await instagram_service.close()
 
     async def _run_if_needed(self) -> None:
         """매 시간마다 실행하여 각 스케줄의 설정된 시간에 맞는 것만 처리"""
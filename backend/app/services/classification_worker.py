@@ -1,7 +1,7 @@
 import asyncio
 import logging
 import threading
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
 from sqlalchemy import or_
@@ -15,10 +15,11 @@ from app.services.openai_service import OpenAIService
 logger = logging.getLogger(__name__)
 
 KST_OFFSET = timedelta(hours=9)
+KST = timezone(KST_OFFSET)
 
 
 def now_kst() -> datetime:
-    return datetime.utcnow() + KST_OFFSET
+    return datetime.now(KST).replace(tzinfo=None)
 
 
 class ClassificationWorker:
@@ -1,10 +1,10 @@
 import asyncio
 import logging
 import threading
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from sqlalchemy import create_engine, or_
+from sqlalchemy import create_engine, func, or_
 from sqlalchemy.orm import Session, sessionmaker
 
 from ..db.models import CollectionJob
@@ -16,10 +16,11 @@ from .s3_service import S3Service
 logger = logging.getLogger(__name__)
 
 KST_OFFSET = timedelta(hours=9)
+KST = timezone(KST_OFFSET)
 
 
 def now_kst() -> datetime:
-    return datetime.utcnow() + KST_OFFSET
+    return datetime.now(KST).replace(tzinfo=None)
 
 class CollectionWorker:
     """백그라운드에서 수집 작업을 처리하는 워커"""
@@ -171,19 +172,33 @@ class CollectionWorker:
         finally:
             db.close()
     
+    @staticmethod
+    def _claim_job(db: Session, job_id: str, stage_status, values: dict) -> bool:
+        """단계 상태가 pending인 작업을 processing으로 원자적으로 변경하고 성공 여부 반환
+
+        WHERE 조건에 pending을 포함한 한 번의 UPDATE이므로 여러 호출이 같은 작업을 골라도
+        한 곳에서만 갱신에 성공한다.
+        """
+        claimed = db.query(CollectionJob).filter(
+            CollectionJob.job_id == job_id,
+            stage_status == "pending"
+        ).update({CollectionJob.status: "processing", **values}, synchronize_session=False)
+        db.commit()
+        return claimed > 0
+
     async def process_profile_only(self, job_id: str):
         """프로필만 수집 (1단계)"""
         db = self.Session()
+        brightdata_service = None
         try:
-            job = db.query(CollectionJob).filter(CollectionJob.job_id == job_id).first()
-            if not job or job.profile_status != "pending":
+            # 대기 상태인 경우에만 processing으로 변경 (조건부 UPDATE로 선점하여
+            # 동시에 같은 작업을 고른 다른 호출/워커가 중복 처리하지 않도록 함)
+            if not self._claim_job(db, job_id, CollectionJob.profile_status, {
+                CollectionJob.profile_status: "processing",
+                CollectionJob.started_at: now_kst(),
+            }):
                 return
-            
-            # 작업 상태를 processing으로 변경
-            job.status = "processing"
-            job.profile_status = "processing"
-            job.started_at = now_kst()
-            db.commit()
+            job = db.query(CollectionJob).filter(CollectionJob.job_id == job_id).first()
             
             logger.info(f"🔄 [프로필 수집 시작] {job.username} ({job.url})")
             
@@ -263,22 +278,23 @@ class CollectionWorker:
             except Exception:
                 db.rollback()
         finally:
+            # BrightData HTTP 세션은 작업마다 새로 만들어지므로 작업 종료 시 닫음
+            if brightdata_service is not None:
+                await brightdata_service.close()
             db.close()
     
     async def process_reels_only(self, job_id: str):
         """릴스만 수집 (2단계)"""
         db = self.Session()
+        brightdata_service = None
         try:
-            job = db.query(CollectionJob).filter(CollectionJob.job_id == job_id).first()
-            if not job or job.reels_status != "pending":
+            # 대기 상태인 경우에만 processing으로 변경 (조건부 UPDATE로 선점)
+            if not self._claim_job(db, job_id, CollectionJob.reels_status, {
+                CollectionJob.reels_status: "processing",
+                CollectionJob.started_at: func.coalesce(CollectionJob.started_at, now_kst()),
+            }):
                 return
-            
-            # 작업 상태를 processing으로 변경
-            job.status = "processing"
-            job.reels_status = "processing"
-            if not job.started_at:
-                job.started_at = now_kst()
-            db.commit()
+            job = db.query(CollectionJob).filter(CollectionJob.job_id == job_id).first()
             
             logger.info(f"🔄 [릴스 수집 시작] {job.username} ({job.url})")
             
@@ -347,11 +363,15 @@ class CollectionWorker:
             except Exception:
                 db.rollback()
         finally:
+            # BrightData HTTP 세션은 작업마다 새로 만들어지므로 작업 종료 시 닫음
+            if brightdata_service is not None:
+                await brightdata_service.close()
             db.close()
     
     async def process_single_job(self, job_id: str):
         """개별 작업 처리"""
         db = self.Session()
+        brightdata_service = None
         try:
             # 작업 조회 및 상태 확인
             job = db.query(CollectionJob).filter(CollectionJob.job_id == job_id).first()
@@ -522,6 +542,9 @@ class CollectionWorker:
                 logger.error(f"작업 상태 업데이트 실패: {str(commit_error)}")
                 db.rollback()
         finally:
+            # BrightData HTTP 세션은 작업마다 새로 만들어지므로 작업 종료 시 닫음
+            if brightdata_service is not None:
+                await brightdata_service.close()
             db.close()
     
     async def save_collected_data(self, job: CollectionJob, result: dict, influencer_service: InfluencerService, username: str):
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from typing import List, Optional
+import time
+from typing import List, Optional, Tuple
 
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
 
 from app.db import models
@@ -17,8 +19,27 @@ class InstagramGradeService:
         ("프리미엄", 100001, None),
     ]
 
+    # 등급 구간은 거의 바뀌지 않으므로 프로세스 내에서 짧게 캐시
+    # 구간을 수정하는 API가 없어 DB에서 직접 바꾼 값은 각 프로세스에 최대 TTL만큼 늦게 반영됨
+    THRESHOLD_CACHE_TTL = 60.0
+
+    def __init__(self) -> None:
+        self._threshold_cache: Optional[Tuple[float, List[Tuple[int, Optional[int], str]]]] = None
+        self._defaults_ensured = False
+
+    @property
+    def defaults_ensured(self) -> bool:
+        """이 프로세스에서 기본 등급 구간 확인을 이미 마쳤는지 여부."""
+        return self._defaults_ensured
+
+    def invalidate_cache(self) -> None:
+        """등급 구간 캐시 무효화 (구간 변경 후 호출)."""
+        self._threshold_cache = None
+
     def ensure_default_thresholds(self, db: Session) -> None:
-        """기본 등급 구간이 없으면 삽입."""
+        """기본 등급 구간이 없으면 삽입 (프로세스당 한 번만 확인)."""
+        if self._defaults_ensured:
+            return
         existing = {
             threshold.grade_name
             for threshold in db.query(models.InstagramGradeThreshold).all()
@@ -36,6 +57,8 @@ class InstagramGradeService:
                 created = True
         if created:
             db.commit()
+            self.invalidate_cache()
+        self._defaults_ensured = True
 
     def get_thresholds(self, db: Session) -> List[models.InstagramGradeThreshold]:
         """등급 구간을 최소 조회수 기준으로 정렬하여 반환."""
@@ -45,15 +68,72 @@ class InstagramGradeService:
             .all()
         )
 
+    def load_thresholds(self, db: Session) -> List[Tuple[int, Optional[int], str]]:
+        """등급 구간을 (최소 조회수, 최대 조회수, 등급명) 튜플 목록으로 반환 (TTL 캐시)."""
+        cached = self._threshold_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self.THRESHOLD_CACHE_TTL:
+            return cached[1]
+        rows = [
+            (threshold.min_view_count, threshold.max_view_count, threshold.grade_name)
+            for threshold in self.get_thresholds(db)
+        ]
+        self._threshold_cache = (now, rows)
+        return rows
+
+    def get_recent_trimmed_average(
+        self, db: Session, username: str, limit: int = 24
+    ) -> Optional[Tuple[float, int, int]]:
+        """최근 릴스(limit개)의 절삭 평균 조회수를 DB에서 계산.
+
+        조회수가 0보다 큰 릴스가 5개 이상이면 상·하위 2개씩 제외하고 평균을 낸다.
+        (평균 조회수, 집계 대상 릴스 수, 절삭 후 릴스 수)를 반환하며, 대상이 없으면 None.
+        """
+        latest = (
+            db.query(models.InfluencerReel.video_play_count.label("views"))
+            .join(
+                models.InfluencerProfile,
+                models.InfluencerReel.profile_id == models.InfluencerProfile.id,
+            )
+            .filter(
+                models.InfluencerProfile.username == username,
+                models.InfluencerReel.video_play_count.isnot(None),
+            )
+            .order_by(models.InfluencerReel.created_at.desc())
+            .limit(limit)
+            .subquery()
+        )
+        ranked = (
+            db.query(
+                latest.c.views,
+                func.row_number().over(order_by=latest.c.views).label("rn"),
+                func.count().over().label("total"),
+            )
+            .filter(latest.c.views > 0)
+            .subquery()
+        )
+        average_views, total, trimmed = (
+            db.query(func.avg(ranked.c.views), func.max(ranked.c.total), func.count())
+            .filter(
+                or_(
+                    ranked.c.total <= 4,
+                    and_(ranked.c.rn > 2, ranked.c.rn <= ranked.c.total - 2),
+                )
+            )
+            .one()
+        )
+        if average_views is None:
+            return None
+        return float(average_views), int(total), int(trimmed)
+
     def get_grade_for_average(self, db: Session, average_views: float) -> Optional[str]:
         """평균 조회수에 대해 등급을 반환."""
-        thresholds = self.get_thresholds(db)
-        for threshold in thresholds:
-            if average_views < threshold.min_view_count:
+        for min_view, max_view, grade_name in self.load_thresholds(db):
+            if average_views < min_view:
                 continue
-            if threshold.max_view_count is not None and average_views > threshold.max_view_count:
+            if max_view is not None and average_views > max_view:
                 continue
-            return threshold.grade_name
+            return grade_name
         return None
 
 
@@ -4,7 +4,7 @@ from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_
 from sqlalchemy.exc import IntegrityError
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from ..db.database import get_db
 from ..db.models import (
@@ -13,15 +13,16 @@ from ..db.models import (
 )
 from ..models.influencer_models import Profile, Post
 from .s3_service import S3Service
-from ..utils.sequence_fixer import safe_db_operation
+from ..utils.sequence_fixer import insert_with_sequence_recovery, safe_db_operation
 
 logger = logging.getLogger(__name__)
 
 KST_OFFSET = timedelta(hours=9)
+KST = timezone(KST_OFFSET)
 
 
 def now_kst() -> datetime:
-    return datetime.utcnow() + KST_OFFSET
+    return datetime.now(KST).replace(tzinfo=None)
 
 class InfluencerService:
     def __init__(self, db: Session, s3_service: Optional[S3Service] = None):
@@ -369,23 +370,23 @@ class InfluencerService:
                 existing_analysis.prompt_used = prompt_used
                 existing_analysis.created_at = now_kst()
                 existing_analysis.reel_id = reel_id
-                self.db.commit()
-                self.db.refresh(existing_analysis)
                 return existing_analysis
             else:
-                db_analysis = InfluencerAnalysis(
-                    profile_id=profile_id,
-                    analysis_type=analysis_type,
-                    reel_id=reel_id,
-                    analysis_result=analysis_result,
-                    prompt_used=prompt_used
+                # id 충돌(뒤처진 시퀀스)은 ON CONFLICT로 DB에서 처리하므로 예외/롤백 없이 복구
+                analysis_id = insert_with_sequence_recovery(
+                    self.db,
+                    InfluencerAnalysis,
+                    dict(
+                        profile_id=profile_id,
+                        analysis_type=analysis_type,
+                        reel_id=reel_id,
+                        analysis_result=analysis_result,
+                        prompt_used=prompt_used
+                    )
                 )
-                self.db.add(db_analysis)
-                self.db.commit()
-                self.db.refresh(db_analysis)
-                return db_analysis
+                return self.db.get(InfluencerAnalysis, analysis_id)
         
-        # UniqueViolation 발생 시 자동으로 시퀀스 리셋 후 재시도
+        # 커밋은 safe_db_operation에서 수행 (UniqueViolation 발생 시 SAVEPOINT만 되돌리고 시퀀스 리셋 후 재시도)
         return safe_db_operation(
             self.db,
             _save_operation,
@@ -32,6 +32,10 @@ class InstagramService:
         else:
             return "C"
 
+    async def close(self):
+        """Instagram API의 공유 HTTP 세션 종료 (이벤트 루프 종료 전·앱 종료 시 호출)"""
+        await self.instagram_api.close()
+
     async def collect_instagram_post_data(self, post_url: str) -> Optional[Dict[str, Any]]:
         """인스타그램 게시물 데이터 수집"""
         try:
@@ -139,7 +143,11 @@ class InstagramService:
                 "collect_reels": True
             }
             
-            results = await brightdata_service.collect_instagram_data_batch([profile_url], options)
+            try:
+                results = await brightdata_service.collect_instagram_data_batch([profile_url], options)
+            finally:
+                # 호출마다 새로 만든 서비스의 HTTP 세션은 바로 닫음
+                await brightdata_service.close()
             
             if not results or len(results) == 0:
                 print(f"No data received for {username}")
@@ -1,16 +1,74 @@
 import asyncio
 import json
 import logging
+import threading
 import time
+import weakref
 from typing import Dict, Set
 from fastapi import Request
 from starlette.responses import StreamingResponse
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
+CHANNEL_PREFIX = "progress:"
+
+
 class ProgressService:
     def __init__(self):
         self._clients: Dict[str, Set[asyncio.Queue]] = {}
+        # Redis Pub/Sub 모드 (여러 워커 프로세스 간 진행 상황 공유)
+        self._use_redis = settings.progress_backend == "redis"
+        self._relays: Dict[asyncio.Queue, asyncio.Task] = {}
+        # redis.asyncio 클라이언트는 생성된 이벤트 루프에 묶이므로 루프별로 따로 둠
+        # (워커 스레드의 asyncio.run 루프에서 호출해도 다른 루프의 연결을 쓰지 않도록)
+        self._async_redis = weakref.WeakKeyDictionary()
+        self._async_redis_lock = threading.Lock()
+        self._sync_redis = None
+        # 이벤트 루프에서 예약한 발행 Task (완료 전 가비지 컬렉션 방지)
+        self._pending_publishes: Set[asyncio.Task] = set()
+
+    def _get_async_redis(self):
+        loop = asyncio.get_running_loop()
+        with self._async_redis_lock:
+            client = self._async_redis.get(loop)
+            if client is None:
+                import redis.asyncio as aioredis
+                client = aioredis.from_url(settings.redis_url, decode_responses=True)
+                self._async_redis[loop] = client
+            return client
+
+    def _get_sync_redis(self):
+        if self._sync_redis is None:
+            import redis
+            self._sync_redis = redis.Redis.from_url(settings.redis_url, decode_responses=True)
+        return self._sync_redis
+
+    async def _publish(self, session_id: str, message: dict):
+        """Redis 채널로 진행 상황 발행"""
+        try:
+            await self._get_async_redis().publish(
+                CHANNEL_PREFIX + session_id, json.dumps(message, ensure_ascii=False)
+            )
+        except Exception as e:
+            logger.error(f"SSE 메시지 발행 실패: {e}")
+
+    async def _relay(self, session_id: str, queue: asyncio.Queue, pubsub):
+        """구독 중인 Redis 채널의 메시지를 로컬 SSE 큐로 전달"""
+        try:
+            async for item in pubsub.listen():
+                if item.get("type") != "message":
+                    continue
+                try:
+                    await queue.put(json.loads(item["data"]))
+                except (TypeError, ValueError) as e:
+                    logger.error(f"SSE 메시지 파싱 실패: {e}")
+        except asyncio.CancelledError:
+            pass
+        finally:
+            await pubsub.unsubscribe(CHANNEL_PREFIX + session_id)
+            await pubsub.close()
         
     async def add_client(self, session_id: str) -> asyncio.Queue:
         """SSE 클라이언트 추가"""
@@ -19,6 +77,16 @@ class ProgressService:
             
         queue = asyncio.Queue()
         self._clients[session_id].add(queue)
+        if self._use_redis:
+            # 구독을 마친 뒤 큐를 반환해야 그 사이에 발행된 메시지를 놓치지 않음
+            pubsub = self._get_async_redis().pubsub()
+            try:
+                await pubsub.subscribe(CHANNEL_PREFIX + session_id)
+            except Exception:
+                await pubsub.close()
+                await self.remove_client(session_id, queue)
+                raise
+            self._relays[queue] = asyncio.create_task(self._relay(session_id, queue, pubsub))
         
         logger.info(f"SSE 클라이언트 추가: {session_id}, 총 {len(self._clients[session_id])}개 연결")
         return queue
@@ -29,17 +97,29 @@ class ProgressService:
             self._clients[session_id].remove(queue)
             if not self._clients[session_id]:
                 del self._clients[session_id]
+        relay = self._relays.pop(queue, None)
+        if relay:
+            relay.cancel()
         logger.info(f"SSE 클라이언트 제거: {session_id}")
     
     async def send_progress(self, session_id: str, event_type: str, data: dict):
         """특정 세션의 모든 클라이언트에게 진행 상황 전송"""
+        if self._use_redis:
+            message = {
+                "event": event_type,
+                "data": data,
+                "timestamp": str(time.time())
+            }
+            await self._publish(session_id, message)
+            return
+
         if session_id not in self._clients:
             return
             
         message = {
             "event": event_type,
             "data": data,
-            "timestamp": str(asyncio.get_event_loop().time())
+            "timestamp": str(time.time())
         }
         
         # 연결이 끊어진 큐들을 제거하기 위한 임시 리스트
@@ -77,17 +157,32 @@ class ProgressService:
             # 간단한 로깅으로 대체 (SSE 전송은 별도로 처리)
             logger.info(f"Progress Update: {session_id} - {event_type}: {progress_percent}% - {message}")
             
+            message_data = {
+                "event": event_type,
+                "data": {
+                    "progress": progress_percent,
+                    "message": message
+                },
+                "timestamp": str(time.time())
+            }
+
+            if self._use_redis:
+                try:
+                    loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    # 이벤트 루프 밖(동기 코드)에서는 바로 발행
+                    self._get_sync_redis().publish(
+                        CHANNEL_PREFIX + session_id, json.dumps(message_data, ensure_ascii=False)
+                    )
+                    return
+                # 비동기 코드에서 호출되면 Redis 왕복이 이벤트 루프를 막지 않도록 Task로 예약
+                task = loop.create_task(self._publish(session_id, message_data))
+                self._pending_publishes.add(task)
+                task.add_done_callback(self._pending_publishes.discard)
+                return
+
             # 클라이언트가 연결되어 있는 경우에만 메시지 전송 시도
             if session_id in self._clients and self._clients[session_id]:
-                message_data = {
-                    "event": event_type,
-                    "data": {
-                        "progress": progress_percent,
-                        "message": message
-                    },
-                    "timestamp": str(time.time())
-                }
-                
                 # 각 클라이언트 큐에 메시지 추가 (논블로킹)
                 for queue in list(self._clients[session_id]):
                     try:
@@ -100,4 +195,4 @@ class ProgressService:
             logger.error(f"진행 상황 업데이트 실패: {e}")
 
 # 글로벌 인스턴스
-progress_service = ProgressService()
\ No newline at end of file
+progress_service = ProgressService()
@@ -1,5 +1,8 @@
+import asyncio
 import boto3
 import os
+import threading
+from botocore.config import Config
 import uuid
 from io import BytesIO
 from PIL import Image
@@ -8,32 +11,59 @@ from typing import Optional
 
 from app.core.config import settings
 
+# 스케줄러가 여러 캠페인의 썸네일을 동시에 업로드하므로 기본값(10)보다 큰 커넥션 풀 사용
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 5},
+    tcp_keepalive=True,
+    s3={'addressing_style': 'virtual'},
+)
+
+ALLOWED_IMAGE_EXTENSIONS = frozenset({'jpg', 'jpeg', 'png', 'gif'})
+
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def get_s3_client():
+    """프로세스 전체에서 공유하는 boto3 S3 클라이언트 반환 (boto3 client는 thread-safe)"""
+    global _shared_client
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                _shared_client = boto3.client(
+                    's3',
+                    aws_access_key_id=settings.s3_access_key_id,
+                    aws_secret_access_key=settings.s3_secret_access_key,
+                    region_name=settings.s3_region,
+                    config=S3_CLIENT_CONFIG,
+                )
+    return _shared_client
+
+
 class S3Service:
     def __init__(self):
-        self.s3_client = boto3.client(
-            's3',
-            aws_access_key_id=settings.s3_access_key_id,
-            aws_secret_access_key=settings.s3_secret_access_key,
-            region_name=settings.s3_region
-        )
+        self.s3_client = get_s3_client()
         self.bucket_name = settings.s3_bucket
+        self._url_prefix = f"https://{self.bucket_name}.s3.{settings.s3_region}.amazonaws.com/"
 
     async def upload_image_from_url(self, image_url: str, folder: str = "goodwave") -> Optional[str]:
         try:
-            # Download image from URL
-            response = requests.get(image_url)
+            # Download image from URL (블로킹 I/O는 스레드에서 실행하여 이벤트 루프를 막지 않음)
+            response = await asyncio.to_thread(requests.get, image_url, timeout=30)
             response.raise_for_status()
             
             # Create unique filename
             file_extension = image_url.split('.')[-1].split('?')[0]
-            if file_extension not in ['jpg', 'jpeg', 'png', 'gif']:
+            if file_extension not in ALLOWED_IMAGE_EXTENSIONS:
                 file_extension = 'jpg'
             
             filename = f"{uuid.uuid4().hex}.{file_extension}"
             s3_key = f"{folder}/{filename}"
             
             # Upload to S3
-            self.s3_client.put_object(
+            await asyncio.to_thread(
+                self.s3_client.put_object,
                 Bucket=self.bucket_name,
                 Key=s3_key,
                 Body=response.content,
@@ -42,8 +72,7 @@ class S3Service:
             )
             
             # Return public URL
-            s3_url = f"https://{self.bucket_name}.s3.{settings.s3_region}.amazonaws.com/{s3_key}"
-            return s3_url
+            return self._url_prefix + s3_key
             
         except Exception as e:
             print(f"Error uploading image to S3: {str(e)}")
@@ -58,7 +87,8 @@ class S3Service:
             # Extract S3 key from URL
             s3_key = s3_url.split('.amazonaws.com/')[-1]
             
-            self.s3_client.delete_object(
+            await asyncio.to_thread(
+                self.s3_client.delete_object,
                 Bucket=self.bucket_name,
                 Key=s3_key
             )
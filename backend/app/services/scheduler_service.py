@@ -1,7 +1,12 @@
 import asyncio
-from datetime import datetime, timedelta, time
-from sqlalchemy.orm import Session
-from typing import List, Optional
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, time, timezone
+from sqlalchemy import and_, exists, func, insert, tuple_
+from sqlalchemy.orm import Session, joinedload, raiseload
+from typing import Dict, List, Optional, Set, Tuple
 
 from app.db.database import SessionLocal
 import re
@@ -13,17 +18,136 @@ from app.services.openai_service import OpenAIService
 from app.services.grade_service import instagram_grade_service
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+# 채널별 오늘 수집 여부 판단 기준 (릴스/포스트는 campaign_reel_collection_jobs, 블로그는 campaign_blogs)
+_DEDUP_GROUPS = {
+    'instagram_post': 'instagram',
+    'instagram_reel': 'instagram',
+    'blog': 'blog',
+}
+
+# 블로그 키워드 순위 조회(네이버 검색 API) 동시 요청 수 제한
+_RANKING_CHECK_CONCURRENCY = 4
+
+# 키워드 fallback 추출용 토큰 패턴 (한글/영문/숫자, 2글자 이상)
+_TOKEN_RE = re.compile(r'[가-힣a-zA-Z0-9]{2,}')
+
 KST_OFFSET = timedelta(hours=9)
+KST = timezone(KST_OFFSET)
+
+
+def _scheduler_concurrency() -> int:
+    """동시에 처리할 스케줄 수 (설정이 0 이하이면 Semaphore가 모든 작업을 막으므로 기본값 4로 대체)"""
+    return settings.scheduler_concurrency if settings.scheduler_concurrency > 0 else 4
+
+
+# SchedulerService는 요청·틱마다 생성되므로 스레드 풀은 인스턴스가 아닌 프로세스 전체에서 공유 (최초 사용 시 생성)
+# 두 풀 모두 동시 스케줄 수만큼 스레드를 두어 Semaphore가 허용한 스케줄이 풀에서 대기하지 않도록 함
+# (스케줄 하나는 한 번에 하나의 호출만 await하므로 스케줄 수보다 많을 필요는 없음)
+_pools: Dict[str, ThreadPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def _shared_pool(name: str) -> ThreadPoolExecutor:
+    """이름별 공유 스레드 풀 반환 (없으면 생성)"""
+    with _pools_lock:
+        pool = _pools.get(name)
+        if pool is None:
+            pool = ThreadPoolExecutor(max_workers=_scheduler_concurrency(), thread_name_prefix=f"scheduler-{name}")
+            _pools[name] = pool
+        return pool
 
 def now_kst() -> datetime:
-    """한국 시간(KST) 기준 현재 시간 반환"""
-    return datetime.utcnow() + KST_OFFSET
+    """한국 시간(KST) 기준 현재 시간 반환
+
+    DB 컬럼(timezone 없는 DateTime)과 비교·저장되므로 tzinfo를 제거한 KST 벽시계 시간을 반환.
+    (aware 값을 저장하면 psycopg2가 timestamptz로 전달하여 세션 타임존 기준으로 변환됨)
+    """
+    return datetime.now(KST).replace(tzinfo=None)
 
 class SchedulerService:
     def __init__(self):
-        self.db = SessionLocal()
-        self.openai_service = OpenAIService(self.db)
-        instagram_grade_service.ensure_default_thresholds(self.db)
+        # DB 세션은 실행 단위(run_scheduled_collection 등)로 열고 닫으며 인스턴스에 보관하지 않음
+        self.openai_service = OpenAIService()
+        # 앱 시작 시(lifespan) 이미 확인했다면 세션을 열지 않음 (cron 등 단독 실행 시에만 확인)
+        if not instagram_grade_service.defaults_ensured:
+            with SessionLocal() as db:
+                instagram_grade_service.ensure_default_thresholds(db)
+        # 실행 중 미리 조회한 CampaignURL ((campaign_id, url) -> CampaignURL)
+        self._campaign_urls: Optional[Dict[Tuple[int, str], models.CampaignURL]] = None
+        # 릴스 수집 서비스/워커는 스케줄마다 새로 만들지 않고 최초 사용 시 한 번만 생성하여 재사용
+        self._collection_service = None
+        self._worker = None
+        # 틱 전체에서 공유하는 블로그 순위 조회 동시 요청 제한 (run_scheduled_collection 시작 시 생성)
+        self._ranking_semaphore: Optional[asyncio.Semaphore] = None
+        # 릴스 작업 멱등성 캐시용 Redis 클라이언트 (reel_job_cache_enabled일 때 지연 생성)
+        self._reel_job_cache = None
+
+    @property
+    def collection_service(self):
+        """캠페인 릴스 수집 서비스 (지연 생성)"""
+        if self._collection_service is None:
+            from app.services.campaign_reel_collection_service import CampaignReelCollectionService
+            self._collection_service = CampaignReelCollectionService()
+        return self._collection_service
+
+    @property
+    def worker(self):
+        """수집 워커 (지연 생성)"""
+        if self._worker is None:
+            from app.services.collection_worker import CollectionWorker
+            self._worker = CollectionWorker()
+        return self._worker
+
+    def _get_reel_job_cache(self):
+        if not settings.reel_job_cache_enabled:
+            return None
+        if self._reel_job_cache is None:
+            import redis.asyncio as aioredis
+            self._reel_job_cache = aioredis.from_url(settings.redis_url, decode_responses=True)
+        return self._reel_job_cache
+
+    @staticmethod
+    def _reel_job_cache_key(campaign_id: int, campaign_url: str, current_time: datetime) -> str:
+        """(캠페인, URL, KST 날짜·시간대) 단위 캐시 키 - 같은 시간대 재실행만 같은 키를 공유"""
+        bucket = current_time.strftime("%Y-%m-%dT%H")
+        digest = hashlib.blake2b(f"{campaign_id}:{campaign_url}:{bucket}".encode(), digest_size=8).hexdigest()
+        return f"reel_job:{digest}"
+
+    @staticmethod
+    def _reel_job_cache_ttl(current_time: datetime) -> int:
+        """키의 시간대가 끝날 때까지 남은 초 (설정값을 넘지 않음) - 지난 시간대 키를 남겨 두지 않음"""
+        remaining = 3600 - (current_time.minute * 60 + current_time.second)
+        return max(1, min(settings.reel_job_cache_ttl, remaining))
+
+    async def _get_cached_job_ids(self, cache_key: str) -> List[int]:
+        cache = self._get_reel_job_cache()
+        if cache is None:
+            return []
+        try:
+            cached = await cache.get(cache_key)
+        except Exception as e:  # 캐시 장애 시 캐시 없이 진행
+            logger.warning(f"릴스 작업 캐시 조회 실패: {e}")
+            return []
+        return [int(job_id) for job_id in cached.split(",")] if cached else []
+
+    async def _cache_job_ids(self, cache_key: str, ttl: int, job_ids: List[int]) -> None:
+        cache = self._get_reel_job_cache()
+        if cache is None or not job_ids:
+            return
+        try:
+            await cache.setex(cache_key, ttl, ",".join(map(str, job_ids)))
+        except Exception as e:
+            logger.warning(f"릴스 작업 캐시 저장 실패: {e}")
+
+    async def _run_db(self, func, *args):
+        """짧은 동기 ORM 호출을 DB 스레드 풀에서 실행 (이벤트 루프 블로킹 방지)
+
+        스케줄 세션은 한 태스크 안에서 await로 순차 사용되므로 다른 스레드에서 실행해도
+        동시에 접근되지 않는다.
+        """
+        return await asyncio.get_running_loop().run_in_executor(_shared_pool("db"), func, *args)
 
     @staticmethod
     def _is_reel_url(url: str) -> bool:
@@ -32,7 +156,7 @@ class SchedulerService:
         lowered = url.lower()
         return "/reel/" in lowered or "/reels/" in lowered
 
-    def _ensure_reel_channel(self, schedule: models.CollectionSchedule) -> None:
+    def _ensure_reel_channel(self, schedule: models.CollectionSchedule, db: Session) -> None:
         """스케줄 및 관련 URL의 채널을 릴스로 정규화"""
         updated = False
 
@@ -40,21 +164,27 @@ class SchedulerService:
             schedule.channel = 'instagram_reel'
             updated = True
 
-        campaign_url = (
-            self.db.query(models.CampaignURL)
-            .filter(
-                models.CampaignURL.campaign_id == schedule.campaign_id,
-                models.CampaignURL.url == schedule.campaign_url,
+        if self._campaign_urls is not None:
+            campaign_url = self._campaign_urls.get((schedule.campaign_id, schedule.campaign_url))
+            if campaign_url is not None:
+                # 미리 조회한 객체를 현재 스케줄의 세션으로 가져옴
+                campaign_url = db.merge(campaign_url, load=False)
+        else:
+            campaign_url = (
+                db.query(models.CampaignURL)
+                .filter(
+                    models.CampaignURL.campaign_id == schedule.campaign_id,
+                    models.CampaignURL.url == schedule.campaign_url,
+                )
+                .first()
             )
-            .first()
-        )
 
         if campaign_url and campaign_url.channel != 'instagram_reel':
             campaign_url.channel = 'instagram_reel'
             updated = True
 
         if updated:
-            self.db.flush()
+            db.flush()
 
     async def run_scheduled_collection(self, *, force_run_all: bool = False, run_hour: Optional[int] = None) -> dict:
         """정기 수집 실행 - 각 스케줄의 설정된 시간(시)에 맞는 것만 실행
@@ -67,50 +197,102 @@ class SchedulerService:
         skipped_count = 0
         errors: List[dict] = []
 
+        db = SessionLocal()
         try:
             current_time = now_kst()
             current_hour = run_hour if run_hour is not None else current_time.hour
-            print(
+            logger.info(
                 f"Starting scheduled collection at {current_time} (KST) - "
                 f"checking for schedules at {current_hour:02d}:00 "
                 f"(force_run_all={force_run_all})"
             )
             
             # 활성 스케줄 조회 (오늘 날짜가 수집 기간 내에 있는 것만) - 한국 시간 기준
+            # 컬럼에 CAST를 적용하면 인덱스를 사용할 수 없으므로 오늘의 시작/끝 시각으로 비교
+            # 오늘 범위 [today_start, today_end)는 틱마다 한 번만 계산하여 하위 메서드에 전달
             today = current_time.date()
-            active_schedules = self.db.query(models.CollectionSchedule).filter(
+            today_start = datetime.combine(today, time.min)
+            today_end = today_start + timedelta(days=1)
+            # schedule.campaign은 스케줄마다 lazy load되지 않도록 함께 조회
+            schedule_options = [joinedload(models.CollectionSchedule.campaign)]
+            if settings.scheduler_raiseload:
+                # 개발 환경: 하위 로직에서 추가 lazy load(N+1)가 발생하면 즉시 오류로 드러나도록 함
+                schedule_options = [
+                    joinedload(models.CollectionSchedule.campaign).raiseload('*'),
+                    raiseload('*'),
+                ]
+            active_schedules = db.query(models.CollectionSchedule).options(
+                *schedule_options
+            ).filter(
                 models.CollectionSchedule.is_active == True,
-                models.CollectionSchedule.start_date.cast(models.Date) <= today,
-                models.CollectionSchedule.end_date.cast(models.Date) >= today
+                models.CollectionSchedule.start_date < today_end,
+                models.CollectionSchedule.end_date >= today_start
             ).all()
             
-            print(f"Found {len(active_schedules)} active schedules")
+            logger.info(f"Found {len(active_schedules)} active schedules")
+
+            campaign_ids = list({schedule.campaign_id for schedule in active_schedules})
+            self._campaign_urls = {
+                (campaign_url.campaign_id, campaign_url.url): campaign_url
+                for campaign_url in db.query(models.CampaignURL).filter(
+                    models.CampaignURL.campaign_id.in_(campaign_ids)
+                )
+            }
+
+            # 오늘 이미 수집된 (캠페인, URL) 목록을 스케줄마다 조회하지 않고 한 번에 조회
+            collected_today = self._load_collected_today(
+                db,
+                today_start,
+                today_end,
+                list({(schedule.campaign_id, schedule.campaign_url) for schedule in active_schedules})
+            )
             
             # 각 스케줄의 설정된 시간(시)과 현재 시간(시)이 일치하는 것만 처리
+            matched_schedules: List[models.CollectionSchedule] = []
             for schedule in active_schedules:
-                try:
-                    # 스케줄 시간 확인 (기본값 9시)
-                    schedule_hour = schedule.schedule_hour if hasattr(schedule, 'schedule_hour') and schedule.schedule_hour is not None else 9
-                    
-                    # 현재 시간(시)이 스케줄 시간(시)과 일치하는지 확인
-                    if force_run_all or (current_hour == schedule_hour):
-                        print(f"✅ Schedule {schedule.id} matches current hour ({schedule_hour:02d}:00) - processing")
-                        await self._process_schedule(schedule)
-                        # 각 스케줄 처리 후 즉시 커밋하여 다음 스케줄의 중복 체크가 정확히 작동하도록 함
-                        self.db.commit()
-                        processed_count += 1
-                    else:
-                        skipped_count += 1
-                        print(f"⏭️  Schedule {schedule.id} scheduled for {schedule_hour:02d}:00 - skipping (current: {current_hour:02d}:00)")
-                except Exception as e:
-                    print(f"Error processing schedule {schedule.id}: {str(e)}")
-                    import traceback
-                    traceback.print_exc()
-                    self.db.rollback()
-                    errors.append({"schedule_id": getattr(schedule, "id", None), "error": str(e)})
-                    continue
+                # 스케줄 시간 확인 (기본값 9시)
+                schedule_hour = schedule.schedule_hour if hasattr(schedule, 'schedule_hour') and schedule.schedule_hour is not None else 9
+                
+                # 현재 시간(시)이 스케줄 시간(시)과 일치하는지 확인
+                if force_run_all or (current_hour == schedule_hour):
+                    logger.debug(f"✅ Schedule {schedule.id} matches current hour ({schedule_hour:02d}:00) - processing")
+                    matched_schedules.append(schedule)
+                else:
+                    skipped_count += 1
+                    logger.debug(f"⏭️  Schedule {schedule.id} scheduled for {schedule_hour:02d}:00 - skipping (current: {current_hour:02d}:00)")
+
+            # 스케줄별 독립 세션으로 동시 처리 (외부 API 대기 시간이 겹치도록, 동시 실행 수 제한)
+            semaphore = asyncio.Semaphore(_scheduler_concurrency())
+            # 순위 조회 제한은 스케줄별이 아니라 틱 전체에 적용 (동시 스케줄 수만큼 배로 늘지 않도록)
+            self._ranking_semaphore = asyncio.Semaphore(_RANKING_CHECK_CONCURRENCY)
+
+            async def _run_one(schedule: models.CollectionSchedule) -> None:
+                async with semaphore:
+                    schedule_db = SessionLocal()
+                    try:
+                        await self._process_schedule(
+                            schedule_db.merge(schedule, load=False), schedule_db, collected_today,
+                            today_bounds=(today_start, today_end)
+                        )
+                        schedule_db.commit()
+                    except Exception:
+                        schedule_db.rollback()
+                        raise
+                    finally:
+                        schedule_db.close()
+
+            results = await asyncio.gather(
+                *(_run_one(schedule) for schedule in matched_schedules),
+                return_exceptions=True
+            )
+            for schedule, result in zip(matched_schedules, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error processing schedule {schedule.id}: {str(result)}", exc_info=result)
+                    errors.append({"schedule_id": schedule.id, "error": str(result)})
+                else:
+                    processed_count += 1
             
-            print(f"Scheduled collection completed: {processed_count} processed, {skipped_count} skipped at {now_kst()} (KST)")
+            logger.info(f"Scheduled collection completed: {processed_count} processed, {skipped_count} skipped at {now_kst()} (KST)")
             return {
                 "processed_count": processed_count,
                 "skipped_count": skipped_count,
@@ -121,7 +303,8 @@ class SchedulerService:
             }
             
         except Exception as e:
-            print(f"Error in scheduled collection: {str(e)}")
+            logger.exception(f"Error in scheduled collection: {str(e)}")
+            db.rollback()
             return {
                 "processed_count": processed_count,
                 "skipped_count": skipped_count,
@@ -131,106 +314,177 @@ class SchedulerService:
                 "errors": errors + [{"schedule_id": None, "error": str(e)}],
             }
         finally:
-            self.db.close()
+            self._campaign_urls = None
+            self._ranking_semaphore = None
+            db.close()
+
+    def _load_collected_today(
+        self,
+        db: Session,
+        today_start: datetime,
+        today_end: datetime,
+        schedule_keys: Optional[List[Tuple[int, str]]] = None
+    ) -> Dict[str, Set[Tuple[int, str]]]:
+        """오늘 이미 수집된 (campaign_id, url) 목록을 테이블별 한 번의 쿼리로 조회
+
+        Args:
+            schedule_keys: 지정 시 해당 (campaign_id, url) 조합만 조회
+        """
+        job_query = db.query(
+            models.CampaignReelCollectionJob.campaign_id,
+            models.CampaignReelCollectionJob.reel_url
+        ).filter(
+            models.CampaignReelCollectionJob.status == "completed",
+            models.CampaignReelCollectionJob.completed_at >= today_start,
+            models.CampaignReelCollectionJob.completed_at < today_end,
+            models.CampaignReelCollectionJob.user_posted.isnot(None)
+        )
+        blog_query = db.query(
+            models.CampaignBlog.campaign_id,
+            models.CampaignBlog.campaign_url
+        ).filter(
+            models.CampaignBlog.collection_date >= today_start,
+            models.CampaignBlog.collection_date < today_end
+        )
+        if schedule_keys is not None:
+            job_query = job_query.filter(
+                tuple_(
+                    models.CampaignReelCollectionJob.campaign_id,
+                    models.CampaignReelCollectionJob.reel_url
+                ).in_(schedule_keys)
+            )
+            blog_query = blog_query.filter(
+                tuple_(models.CampaignBlog.campaign_id, models.CampaignBlog.campaign_url).in_(schedule_keys)
+            )
+
+        # 캠페인 기간이 길면 행 수가 많아지므로 전체 결과를 리스트로 만들지 않고 청크 단위로 스트리밍
+        return {
+            "instagram": {(campaign_id, url) for campaign_id, url in job_query.yield_per(500)},
+            "blog": {(campaign_id, url) for campaign_id, url in blog_query.yield_per(500)},
+        }
+
+    def _is_collected_today(
+        self,
+        db: Session,
+        schedule: models.CollectionSchedule,
+        today_start: datetime,
+        today_end: datetime
+    ) -> bool:
+        """단일 스케줄의 오늘 수집 여부를 EXISTS 한 번으로 확인 (객체 로딩 없이 첫 행에서 종료)"""
+        if _DEDUP_GROUPS.get(schedule.channel) == 'blog':
+            condition = and_(
+                models.CampaignBlog.campaign_id == schedule.campaign_id,
+                models.CampaignBlog.campaign_url == schedule.campaign_url,
+                models.CampaignBlog.collection_date >= today_start,
+                models.CampaignBlog.collection_date < today_end
+            )
+        else:
+            condition = and_(
+                models.CampaignReelCollectionJob.campaign_id == schedule.campaign_id,
+                models.CampaignReelCollectionJob.reel_url == schedule.campaign_url,
+                models.CampaignReelCollectionJob.status == "completed",
+                models.CampaignReelCollectionJob.completed_at >= today_start,
+                models.CampaignReelCollectionJob.completed_at < today_end,
+                models.CampaignReelCollectionJob.user_posted.isnot(None)
+            )
+        return bool(db.query(exists().where(condition)).scalar())
+
+    async def _process_schedule(
+        self,
+        schedule: models.CollectionSchedule,
+        db: Session,
+        collected_today: Optional[Dict[str, Set[Tuple[int, str]]]] = None,
+        today_bounds: Optional[Tuple[datetime, datetime]] = None
+    ):
+        """개별 스케줄 처리
 
-    async def _process_schedule(self, schedule: models.CollectionSchedule):
-        """개별 스케줄 처리"""
+        Args:
+            collected_today: run_scheduled_collection에서 미리 조회한 오늘 수집 완료 목록.
+                없으면 해당 스케줄에 대해서만 EXISTS로 확인
+            today_bounds: 틱 시작 시 계산한 오늘 범위 (today_start, today_end). 없으면 현재 시각 기준으로 계산
+        """
         campaign = schedule.campaign
         collection_date = now_kst()  # 한국 시간 기준
         today = collection_date.date()
+        if today_bounds is None:
+            today_start = datetime.combine(today, time.min)
+            today_bounds = (today_start, today_start + timedelta(days=1))
         
-        print(f"Processing schedule for campaign: {campaign.name}, channel: {schedule.channel}, date: {today} (KST)")
+        logger.info(f"Processing schedule for campaign: {campaign.name}, channel: {schedule.channel}, date: {today} (KST)")
         
         # 이전 스케줄에서 커밋된 데이터를 반영하기 위해 flush
-        self.db.flush()
+        db.flush()
+
+        dedup_group = _DEDUP_GROUPS.get(schedule.channel)
+        if dedup_group is None:
+            logger.warning(f"Unsupported schedule channel: {schedule.channel}")
+            return
+
+        schedule_key = (campaign.id, schedule.campaign_url)
+        if collected_today is None:
+            collected_today = {"instagram": set(), "blog": set()}
+            if self._is_collected_today(db, schedule, *today_bounds):
+                collected_today[dedup_group].add(schedule_key)
         
-        # 오늘 날짜에 이미 수집된 작업이 있는지 확인 (campaign_reel_collection_jobs 테이블 기준)
-        if schedule.channel in ['instagram_post', 'instagram_reel']:
-            # 릴스/포스트의 경우, 오늘 날짜에 완료된 수집 작업이 있는지 확인
-            if schedule.channel == 'instagram_reel' or (schedule.channel == 'instagram_post' and self._is_reel_url(schedule.campaign_url)):
-                today_start = datetime.combine(today, time.min)
-                today_end = datetime.combine(today + timedelta(days=1), time.min)
-                
-                existing_today_job = self.db.query(models.CampaignReelCollectionJob).filter(
-                    models.CampaignReelCollectionJob.campaign_id == campaign.id,
-                    models.CampaignReelCollectionJob.reel_url == schedule.campaign_url,
-                    models.CampaignReelCollectionJob.status == "completed",
-                    models.CampaignReelCollectionJob.completed_at >= today_start,
-                    models.CampaignReelCollectionJob.completed_at < today_end,
-                    models.CampaignReelCollectionJob.user_posted.isnot(None)
-                ).first()
-                
-                if existing_today_job:
-                    print(f"⚠️ 오늘({today}) 이미 완료된 수집 작업이 있습니다. 스킵합니다. (job_id: {existing_today_job.id})")
-                    return
-            else:
-                # 포스트의 경우 (릴스가 아닌 경우) - campaign_reel_collection_jobs 사용
-                today_start = datetime.combine(today, time.min)
-                today_end = datetime.combine(today + timedelta(days=1), time.min)
-                
-                existing_today = self.db.query(models.CampaignReelCollectionJob).filter(
-                    models.CampaignReelCollectionJob.campaign_id == campaign.id,
-                    models.CampaignReelCollectionJob.reel_url == schedule.campaign_url,
-                    models.CampaignReelCollectionJob.status == "completed",
-                    models.CampaignReelCollectionJob.completed_at >= today_start,
-                    models.CampaignReelCollectionJob.completed_at < today_end,
-                    models.CampaignReelCollectionJob.user_posted.isnot(None)
-                ).first()
-                
-                if existing_today:
-                    print(f"⚠️ 오늘({today}) 이미 수집된 데이터가 있습니다. 스킵합니다.")
-                    return
-        elif schedule.channel == 'blog':
-            # 블로그의 경우, 오늘 날짜에 이미 수집된 데이터가 있는지 확인
-            existing_today = self.db.query(models.CampaignBlog).filter(
-                models.CampaignBlog.campaign_id == campaign.id,
-                models.CampaignBlog.campaign_url == schedule.campaign_url,
-                models.CampaignBlog.collection_date >= datetime.combine(today, time.min),
-                models.CampaignBlog.collection_date < datetime.combine(today + timedelta(days=1), time.min)
-            ).first()
-            
-            if existing_today:
-                print(f"⚠️ 오늘({today}) 이미 수집된 데이터가 있습니다. 스킵합니다.")
-                return
+        # 오늘 날짜에 이미 수집된 데이터/완료된 작업이 있는지 확인
+        collected_key_set = collected_today[dedup_group]
+        if schedule_key in collected_key_set:
+            logger.info(f"⚠️ 오늘({today}) 이미 수집된 데이터가 있습니다. 스킵합니다.")
+            return
         
-        print(f"✅ 오늘({today}) 수집 시작")
+        # 같은 틱에서 동일한 (캠페인, URL) 스케줄이 동시에 수집되지 않도록 먼저 등록
+        collected_key_set.add(schedule_key)
+
+        logger.info(f"✅ 오늘({today}) 수집 시작")
         
-        if schedule.channel == 'instagram_post':
-            if self._is_reel_url(schedule.campaign_url):
-                self._ensure_reel_channel(schedule)
-                await self._collect_campaign_instagram_reels(schedule, campaign, collection_date)
+        try:
+            if dedup_group == 'instagram':
+                # 릴스 URL로 등록된 포스트 스케줄은 릴스로 수집 (채널 정보도 릴스로 보정)
+                if schedule.channel == 'instagram_reel' or self._is_reel_url(schedule.campaign_url):
+                    if schedule.channel == 'instagram_post':
+                        self._ensure_reel_channel(schedule, db)
+                    await self._collect_campaign_instagram_reels(schedule, campaign, collection_date, db)
+                else:
+                    await self._collect_campaign_instagram_posts(schedule, campaign, collection_date, db)
             else:
-                await self._collect_campaign_instagram_posts(schedule, campaign, collection_date)
-        elif schedule.channel == 'instagram_reel':
-            await self._collect_campaign_instagram_reels(schedule, campaign, collection_date)
-        elif schedule.channel == 'blog':
-            await self._collect_campaign_blogs(schedule, campaign, collection_date)
+                await self._collect_campaign_blogs(
+                    schedule, campaign, collection_date, db, today_bounds=today_bounds
+                )
+        except Exception:
+            # 실패한 스케줄은 같은 틱의 중복 스케줄이 다시 시도할 수 있도록 해제
+            collected_key_set.discard(schedule_key)
+            raise
 
     async def _collect_campaign_instagram_posts(
         self, 
         schedule: models.CollectionSchedule, 
         campaign: models.Campaign, 
-        collection_date: datetime
+        collection_date: datetime,
+        db: Session
     ):
         """캠페인 인스타그램 게시물 수집"""
         try:
             post_data = await instagram_service.collect_instagram_post_data(schedule.campaign_url)
             if not post_data:
-                print(f"No Instagram post data collected for {schedule.campaign_url}")
+                logger.warning(f"No Instagram post data collected for {schedule.campaign_url}")
                 return
             
             # 사용자 게시물들 수집
             username = post_data.get('username')
             if not username:
-                print(f"Instagram post lacks username for {schedule.campaign_url}")
+                logger.warning(f"Instagram post lacks username for {schedule.campaign_url}")
                 return
             user_posts = await instagram_service.collect_user_posts_thumbnails(username, 24)
             if not user_posts:
                 user_posts = [post_data]
             
-            # 캠페인 테이블에 저장
-            for post in user_posts:
-                db_campaign_post = models.CampaignInstagramPost(
+            # 같은 스냅샷에 중복된 게시물이 있으면 한 건만 저장
+            # (campaign_instagram_posts에는 유니크 제약이 없어 ON CONFLICT로 거를 수 없음)
+            user_posts = list({post['post_id']: post for post in user_posts}.values())
+            
+            # 캠페인 테이블에 저장 (ORM 객체 단위 add 대신 한 번의 executemany INSERT)
+            rows = [
+                dict(
                     campaign_id=campaign.id,
                     campaign_url=schedule.campaign_url,
                     post_id=post['post_id'],
@@ -248,177 +502,282 @@ class SchedulerService:
                     posted_at=post.get('posted_at'),
                     collection_date=collection_date
                 )
-                self.db.add(db_campaign_post)
+                for post in user_posts
+            ]
             
-            # 커밋은 상위 메서드에서 처리하므로 여기서는 flush만 수행
-            self.db.flush()
-            print(f"Collected {len(user_posts)} Instagram posts for campaign {campaign.name}")
+            # 커밋은 상위 메서드에서 처리
+            await self._run_db(db.execute, insert(models.CampaignInstagramPost), rows)
+            logger.info(f"Collected {len(user_posts)} Instagram posts for campaign {campaign.name}")
             
         except Exception as e:
-            print(f"Error collecting campaign Instagram posts: {str(e)}")
-            self.db.rollback()
+            logger.error(f"Error collecting campaign Instagram posts: {str(e)}")
+            raise
 
     async def _collect_campaign_instagram_reels(
         self, 
         schedule: models.CollectionSchedule, 
         campaign: models.Campaign, 
-        collection_date: datetime
+        collection_date: datetime,
+        db: Session
     ):
         """캠페인 인스타그램 릴스 수집 - BrightData API를 통한 신규 수집 + 기존 데이터 동기화"""
         try:
-            from app.services.campaign_reel_collection_service import CampaignReelCollectionService
-            from app.services.collection_worker import CollectionWorker
-            
             campaign_url = schedule.campaign_url
-            # collection_service는 모든 경우에 사용하므로 먼저 생성
-            collection_service = CampaignReelCollectionService()
             
             if "/reel/" in campaign_url:
                 # 특정 릴스 URL인 경우
-                print(f"🔄 특정 릴스 신규 수집 시작: {campaign_url}")
+                logger.info(f"🔄 특정 릴스 신규 수집 시작: {campaign_url}")
                 
-                # 1. 먼저 새로운 수집 작업 생성 (중복 체크는 이미 위에서 수행했으므로 False)
-                jobs = collection_service.add_reel_collection_jobs(
-                    campaign_id=campaign.id,
-                    reel_urls=[campaign_url],
-                    check_existing_data=False  # 중복 체크는 _process_schedule에서 이미 수행
-                )
-                
-                if jobs:
-                    print(f"📋 {len(jobs)}개 새 수집 작업 생성됨")
-                    
-                    # 2. 수집 작업 처리
-                    processed = collection_service.process_pending_jobs(limit=10, campaign_id=campaign.id)
-                    print(f"🔄 {processed}개 작업 BrightData로 전송됨")
-                    
-                    # 3. 완료된 작업들 처리 (30초 대기 후)
-                    await asyncio.sleep(30)
-                    worker = CollectionWorker()
-                    await worker.process_pending_jobs()
-                    print("✅ 수집 워커 완료")
+                # 1~3. 수집 작업 생성·BrightData 전송 후 완료 대기 및 워커 처리
+                await self._dispatch_reel_jobs(campaign.id, campaign_url, [campaign_url], db)
                 
                 # 4. campaign_reel_collection_jobs에 작업이 생성되고 완료되면 자동으로 데이터가 저장됨
                 # 보고서와 화면 모두 campaign_reel_collection_jobs를 참조하므로 별도 동기화 불필요
-                completed_jobs_count = self.db.query(models.CampaignReelCollectionJob).filter(
-                    models.CampaignReelCollectionJob.campaign_id == campaign.id,
-                    models.CampaignReelCollectionJob.status == "completed",
-                    models.CampaignReelCollectionJob.user_posted.isnot(None)
-                ).count()
-                
-                print(f"📊 {completed_jobs_count}개 완료된 릴스 작업 (campaign_reel_collection_jobs 테이블에 저장됨)")
+                self._log_completed_reel_jobs(campaign.id, db)
             else:
                 # 사용자 프로필 URL인 경우, 해당 사용자의 최신 릴스들을 campaign_reel_collection_jobs에 작업으로 생성
+                url_parts = campaign_url.split('/')
                 if "/reels" in campaign_url:
-                    username = campaign_url.split('/')[-2]  # reels 앞의 username 추출
+                    username = url_parts[-2]  # reels 앞의 username 추출
                 else:
-                    username = campaign_url.split('/')[-2] if campaign_url.split('/')[-2] else campaign_url.split('/')[-1]
+                    username = url_parts[-2] or url_parts[-1]
                 
-                print(f"🔄 사용자 릴스 업데이트: {username}")
+                logger.info(f"🔄 사용자 릴스 업데이트: {username}")
                 
-                # 인플루언서 프로필에서 최신 릴스들 가져오기
-                profile = self.db.query(models.InfluencerProfile).filter(
-                    models.InfluencerProfile.username == username
-                ).first()
+                recent_reel_ids = await self._run_db(self._query_recent_reel_ids, username, db)
                 
-                if profile:
-                    recent_reels = self.db.query(models.InfluencerReel).filter(
-                        models.InfluencerReel.profile_id == profile.id
-                    ).order_by(models.InfluencerReel.posted_at.desc()).limit(10).all()
-                    
-                    print(f"📊 {len(recent_reels)}개 최신 릴스 발견")
+                if recent_reel_ids is not None:
+                    logger.info(f"📊 {len(recent_reel_ids)}개 최신 릴스 발견")
                     
-                    # 각 릴스 URL을 campaign_reel_collection_jobs에 작업으로 생성
-                    reel_urls = []
-                    for reel in recent_reels:
-                        # reel_id로 릴스 URL 구성
-                        reel_url = f"https://www.instagram.com/reel/{reel.reel_id}/"
-                        reel_urls.append(reel_url)
+                    # 각 릴스 URL을 campaign_reel_collection_jobs에 작업으로 생성 (reel_id로 릴스 URL 구성)
+                    reel_urls = [f"https://www.instagram.com/reel/{reel_id}/" for reel_id in recent_reel_ids]
                     
                     if reel_urls:
-                        # campaign_reel_collection_jobs에 작업 생성
-                        jobs = collection_service.add_reel_collection_jobs(
-                            campaign_id=campaign.id,
-                            reel_urls=reel_urls,
-                            check_existing_data=False  # 중복 체크는 _process_schedule에서 이미 수행
-                        )
-                        
-                        if jobs:
-                            print(f"📋 {len(jobs)}개 새 수집 작업 생성됨")
-                            
-                            # 수집 작업 처리
-                            processed = collection_service.process_pending_jobs(limit=10, campaign_id=campaign.id)
-                            print(f"🔄 {processed}개 작업 BrightData로 전송됨")
-                            
-                            # 완료된 작업들 처리 (30초 대기 후)
-                            await asyncio.sleep(30)
-                            worker = CollectionWorker()
-                            await worker.process_pending_jobs()
-                            print("✅ 수집 워커 완료")
-                        
-                        completed_jobs_count = self.db.query(models.CampaignReelCollectionJob).filter(
-                            models.CampaignReelCollectionJob.campaign_id == campaign.id,
-                            models.CampaignReelCollectionJob.status == "completed",
-                            models.CampaignReelCollectionJob.user_posted.isnot(None)
-                        ).count()
+                        # campaign_reel_collection_jobs에 작업 생성 후 BrightData로 전송
+                        await self._dispatch_reel_jobs(campaign.id, campaign_url, reel_urls, db)
                         
-                        print(f"📊 {completed_jobs_count}개 완료된 릴스 작업 (campaign_reel_collection_jobs 테이블에 저장됨)")
+                        self._log_completed_reel_jobs(campaign.id, db)
                     else:
-                        print(f"⚠️ {username}의 릴스 URL을 생성할 수 없음")
+                        logger.warning(f"⚠️ {username}의 릴스 URL을 생성할 수 없음")
                 else:
-                    print(f"❌ {username} 프로필을 찾을 수 없음")
+                    logger.warning(f"❌ {username} 프로필을 찾을 수 없음")
             
         except Exception as e:
-            print(f"Error collecting campaign Instagram reels: {str(e)}")
-            self.db.rollback()
+            logger.error(f"Error collecting campaign Instagram reels: {str(e)}")
+            raise
+
+    async def _dispatch_reel_jobs(
+        self,
+        campaign_id: int,
+        campaign_url: str,
+        reel_urls: List[str],
+        db: Session
+    ) -> None:
+        """릴스 수집 작업 생성·BrightData 전송 후 완료 대기 및 워커 처리
+
+        같은 시간대에 이미 전송한 작업이 캐시에 있으면 재전송하지 않고 기존 작업의 완료만 기다림.
+        """
+        # 키와 TTL은 같은 시각 기준으로 계산 (시간대 경계에서 어긋나지 않도록)
+        current_time = now_kst()
+        cache_key = self._reel_job_cache_key(campaign_id, campaign_url, current_time)
+        cached_job_ids = await self._get_cached_job_ids(cache_key)
+        if cached_job_ids:
+            logger.info(f"♻️ 이번 시간대에 전송한 작업 {len(cached_job_ids)}개 재사용: {campaign_url}")
+            await self._await_jobs_complete(cached_job_ids, db)
+            await self.worker.process_pending_jobs()
+            return
+
+        # 작업 생성과 BrightData 전송은 작업당 수 분까지 걸리는 동기 호출이므로 DB 조회와 다른 풀에서 실행
+        # (같은 풀을 쓰면 긴 전송이 스레드를 모두 차지해 다른 스케줄의 짧은 조회가 밀림)
+        job_ids, processed = await asyncio.get_running_loop().run_in_executor(
+            _shared_pool("reel"), self._submit_reel_collection_jobs, campaign_id, reel_urls
+        )
+        if not job_ids:
+            return
+
+        logger.info(f"📋 {len(job_ids)}개 새 수집 작업 생성됨")
+        logger.info(f"🔄 {processed}개 작업 BrightData로 전송됨")
+        await self._cache_job_ids(cache_key, self._reel_job_cache_ttl(current_time), job_ids)
+
+        # BrightData로 전송된 작업이 있으면 완료될 때까지 대기(최대 30초) 후 처리
+        if processed:
+            await self._await_jobs_complete(job_ids, db)
+        await self.worker.process_pending_jobs()
+        logger.info("✅ 수집 워커 완료")
+
+    @staticmethod
+    def _query_recent_reel_ids(username: str, db: Session, limit: int = 10) -> Optional[List[str]]:
+        """인플루언서의 최신 릴스 ID 목록 조회 - 프로필이 없으면 None
+
+        프로필과 최신 릴스 ID를 한 번의 쿼리로 조회 (프로필은 있고 릴스가 없으면 reel_id는 None)
+        URL 생성에는 reel_id만 필요하므로 ORM 객체 대신 컬럼만 조회
+        """
+        profile_rows = (
+            db.query(models.InfluencerProfile.id, models.InfluencerReel.reel_id)
+            .outerjoin(
+                models.InfluencerReel,
+                models.InfluencerReel.profile_id == models.InfluencerProfile.id
+            )
+            .filter(models.InfluencerProfile.username == username)
+            .order_by(models.InfluencerReel.posted_at.desc())
+            .limit(limit)
+            .all()
+        )
+        if not profile_rows:
+            return None
+        return [reel_id for _, reel_id in profile_rows if reel_id is not None]
+
+    def _log_completed_reel_jobs(self, campaign_id: int, db: Session) -> None:
+        """캠페인의 완료된 릴스 작업 수 출력 - 로그 전용 COUNT이므로 DEBUG 레벨에서만 조회"""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        completed_jobs_count = db.query(func.count(models.CampaignReelCollectionJob.id)).filter(
+            models.CampaignReelCollectionJob.campaign_id == campaign_id,
+            models.CampaignReelCollectionJob.status == "completed",
+            models.CampaignReelCollectionJob.user_posted.isnot(None)
+        ).scalar()
+        logger.debug(f"📊 {completed_jobs_count}개 완료된 릴스 작업 (campaign_reel_collection_jobs 테이블에 저장됨)")
+
+    async def _await_jobs_complete(
+        self,
+        job_ids: List[int],
+        db: Session,
+        timeout: float = 30.0,
+        interval: float = 0.5,
+        max_interval: float = 5.0
+    ) -> bool:
+        """전송한 릴스 작업이 모두 pending/processing을 벗어날 때까지 대기 (고정 30초 대기 대체)
+
+        0.5초부터 최대 5초까지 간격을 두 배씩 늘려 가며 상태를 확인하고, timeout을 넘기면 중단.
+
+        Returns:
+            timeout 전에 모든 작업이 끝났으면 True
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            await asyncio.sleep(min(interval, max(deadline - loop.time(), 0)))
+            remaining = await self._run_db(self._count_unfinished_jobs, job_ids, db)
+            if not remaining:
+                return True
+            if loop.time() >= deadline:
+                return False
+            interval = min(interval * 2, max_interval)
+
+    @staticmethod
+    def _count_unfinished_jobs(job_ids: List[int], db: Session) -> int:
+        """아직 pending/processing 상태인 작업 수"""
+        return db.query(func.count(models.CampaignReelCollectionJob.id)).filter(
+            models.CampaignReelCollectionJob.id.in_(job_ids),
+            models.CampaignReelCollectionJob.status.in_(["pending", "processing"])
+        ).scalar()
+
+    def _submit_reel_collection_jobs(self, campaign_id: int, reel_urls: List[str]) -> Tuple[List[int], int]:
+        """릴스 수집 작업 생성 및 BrightData 전송 (동기 - 스레드 풀에서 실행)
+
+        CampaignReelCollectionService는 호출마다 자체 SessionLocal을 열기 때문에
+        스케줄 세션과 공유하지 않고 워커 스레드에서 안전하게 실행할 수 있다.
+        """
+        collection_service = self.collection_service
+        jobs = collection_service.add_reel_collection_jobs(
+            campaign_id=campaign_id,
+            reel_urls=reel_urls,
+            check_existing_data=False  # 중복 체크는 _process_schedule에서 이미 수행
+        )
+        if not jobs:
+            return [], 0
+
+        processed = collection_service.process_pending_jobs(limit=10, campaign_id=campaign_id)
+        return [job.id for job in jobs], processed
 
     async def _collect_campaign_blogs(
         self, 
         schedule: models.CollectionSchedule, 
         campaign: models.Campaign, 
-        collection_date: datetime
+        collection_date: datetime,
+        db: Session,
+        today_bounds: Optional[Tuple[datetime, datetime]] = None
     ):
-        """캠페인 블로그 수집"""
+        """캠페인 블로그 수집
+
+        Args:
+            today_bounds: collection_date가 속한 날짜의 (시작, 다음날 시작). 없으면 collection_date로 계산
+        """
         try:
-            print(f"📊 Collecting blog data for campaign {campaign.name} (ID: {campaign.id})")
-            print(f"   URL: {schedule.campaign_url}")
+            logger.info(f"📊 Collecting blog data for campaign {campaign.name} (ID: {campaign.id})")
+            logger.debug(f"   URL: {schedule.campaign_url}")
             
             blog_data = await blog_service.collect_blog_data(schedule.campaign_url)
             if not blog_data:
-                print(f"❌ No blog data collected for {schedule.campaign_url}")
+                logger.warning(f"❌ No blog data collected for {schedule.campaign_url}")
                 return
             
-            print(f"✅ Blog data received: {blog_data.get('title')} (likes: {blog_data.get('likes_count')}, comments: {blog_data.get('comments_count')})")
+            logger.info(f"✅ Blog data received: {blog_data.get('title')} (likes: {blog_data.get('likes_count')}, comments: {blog_data.get('comments_count')})")
 
-            keywords = await self._generate_campaign_keywords(campaign.id, blog_data.get('title'))
-            print(f"🔍 Checking rankings for {len(keywords)} keywords: {keywords}")
+            keywords = await self._generate_campaign_keywords(campaign.id, blog_data.get('title'), db)
+            logger.debug(f"🔍 Checking rankings for {len(keywords)} keywords: {keywords}")
+            # 키워드별 순위 조회를 동시에 실행 (네이버 API 호출 대기 시간을 겹치되 동시 요청 수는 제한)
+            # 정기 수집 중에는 모든 캠페인이 틱 단위 Semaphore를 공유하고, 단독 호출 시에만 새로 생성
+            ranking_semaphore = self._ranking_semaphore or asyncio.Semaphore(_RANKING_CHECK_CONCURRENCY)
+
+            async def _check_ranking(keyword: str) -> Optional[int]:
+                async with ranking_semaphore:
+                    return await blog_service._check_blog_ranking(schedule.campaign_url, keyword)
+
+            ranking_results = await asyncio.gather(
+                *(_check_ranking(keyword) for keyword in keywords),
+                return_exceptions=True
+            )
             rankings = []
-            for keyword in keywords:
-                print(f"   Checking ranking for keyword: '{keyword}'")
-                ranking = await blog_service._check_blog_ranking(schedule.campaign_url, keyword)
+            for keyword, ranking in zip(keywords, ranking_results):
+                if isinstance(ranking, Exception):
+                    logger.warning(f"   ❌ Ranking check failed for keyword '{keyword}': {ranking}")
+                    continue
                 if ranking:
-                    print(f"   ✅ Found ranking: {ranking} for keyword '{keyword}'")
+                    logger.debug(f"   ✅ Found ranking: {ranking} for keyword '{keyword}'")
                     rankings.append({'keyword': keyword, 'ranking': ranking})
                 else:
-                    print(f"   ⚠️ No ranking found for keyword '{keyword}' (may be outside top 100 or API issue)")
+                    logger.debug(f"   ⚠️ No ranking found for keyword '{keyword}' (may be outside top 100 or API issue)")
 
             # 같은 날짜에 같은 URL의 데이터가 이미 있는지 확인 (중복 방지)
             # collection_date를 날짜만 비교하기 위해 날짜 범위로 필터링
-            collection_date_start = datetime.combine(collection_date.date(), time.min)
-            collection_date_end = datetime.combine(collection_date.date() + timedelta(days=1), time.min)
+            if today_bounds is None:
+                collection_date_start = datetime.combine(collection_date.date(), time.min)
+                today_bounds = (collection_date_start, collection_date_start + timedelta(days=1))
+            collection_date_start, collection_date_end = today_bounds
             
-            existing_today = self.db.query(models.CampaignBlog).filter(
-                models.CampaignBlog.campaign_id == campaign.id,
-                models.CampaignBlog.campaign_url == schedule.campaign_url,
-                models.CampaignBlog.collection_date >= collection_date_start,
-                models.CampaignBlog.collection_date < collection_date_end
-            ).first()
+            existing_today = await self._run_db(
+                db.query(models.CampaignBlog).filter(
+                    models.CampaignBlog.campaign_id == campaign.id,
+                    models.CampaignBlog.campaign_url == schedule.campaign_url,
+                    models.CampaignBlog.collection_date >= collection_date_start,
+                    models.CampaignBlog.collection_date < collection_date_end
+                ).first
+            )
+
+            # 랭킹 행 구성: 순위가 확인된 키워드 + 순위 없는 키워드(None)
+            ranking_rows: List[dict] = []
+            ranking_keywords = set()
+            for ranking_info in rankings:
+                keyword = ranking_info['keyword']
+                if not keyword:
+                    continue
+                ranking_keywords.add(keyword)
+                ranking_rows.append({'keyword': keyword, 'ranking': ranking_info.get('ranking')})
+
+            for keyword in keywords:
+                if keyword and keyword not in ranking_keywords:
+                    ranking_rows.append({'keyword': keyword, 'ranking': None})
             
             if existing_today:
                 # 같은 날짜에 같은 URL의 데이터가 있으면 업데이트
-                print(f"⚠️ 같은 날짜({collection_date.date()})에 이미 수집된 데이터가 있습니다. 업데이트합니다.")
-                # 기존 랭킹 데이터 삭제 (새로운 랭킹 데이터로 교체)
-                for ranking in existing_today.rankings:
-                    self.db.delete(ranking)
+                logger.info(f"⚠️ 같은 날짜({collection_date.date()})에 이미 수집된 데이터가 있습니다. 업데이트합니다.")
+                # 기존 랭킹 데이터는 한 번의 DELETE로 삭제 (새로운 랭킹 데이터로 교체)
+                await self._run_db(
+                    lambda: db.query(models.CampaignBlogRanking).filter(
+                        models.CampaignBlogRanking.campaign_blog_id == existing_today.id
+                    ).delete(synchronize_session=False)
+                )
                 
                 # 데이터 업데이트
                 existing_today.username = blog_data.get('username')
@@ -427,191 +786,63 @@ class SchedulerService:
                 existing_today.comments_count = blog_data.get('comments_count', 0)
                 existing_today.daily_visitors = blog_data.get('daily_visitors', 0)
                 existing_today.posted_at = blog_data.get('posted_at')
-                
-                # 새로운 랭킹 데이터 추가
-                ranking_records: List[models.CampaignBlogRanking] = []
-                ranking_keywords = set()
-                for ranking_info in rankings:
-                    keyword = ranking_info['keyword']
-                    if not keyword:
-                        continue
-                    ranking_keywords.add(keyword)
-                    ranking_records.append(
-                        models.CampaignBlogRanking(
-                            keyword=keyword,
-                            ranking=ranking_info.get('ranking')
-                        )
-                    )
-
-                for keyword in keywords:
-                    if keyword and keyword not in ranking_keywords:
-                        ranking_records.append(
-                            models.CampaignBlogRanking(
-                                keyword=keyword,
-                                ranking=None
-                            )
-                        )
-
-                if ranking_records:
-                    existing_today.rankings.extend(ranking_records)
-                
-                self.db.flush()
-                print(f"✅ Successfully updated blog data in database:")
-                print(f"   - Title: {existing_today.title}")
-                print(f"   - Username: {existing_today.username}")
-                print(f"   - Likes: {existing_today.likes_count}")
-                print(f"   - Comments: {existing_today.comments_count}")
-                print(f"   - Daily Visitors: {existing_today.daily_visitors}")
-                print(f"   - Rankings: {len(ranking_records)} keywords")
-                print(f"✅ Updated blog data for campaign {campaign.name}")
-                return
-
-            # 새로운 데이터 추가 (다른 날짜이거나 같은 날짜에 데이터가 없는 경우)
-            base_entry = models.CampaignBlog(
-                campaign_id=campaign.id,
-                campaign_url=schedule.campaign_url,
-                username=blog_data.get('username'),
-                title=blog_data.get('title'),
-                likes_count=blog_data.get('likes_count', 0),
-                comments_count=blog_data.get('comments_count', 0),
-                daily_visitors=blog_data.get('daily_visitors', 0),
-                product=campaign.product,
-                posted_at=blog_data.get('posted_at'),
-                collection_date=collection_date
-            )
-
-            ranking_records: List[models.CampaignBlogRanking] = []
-            ranking_keywords = set()
-            for ranking_info in rankings:
-                keyword = ranking_info['keyword']
-                if not keyword:
-                    continue
-                ranking_keywords.add(keyword)
-                ranking_records.append(
-                    models.CampaignBlogRanking(
-                        keyword=keyword,
-                        ranking=ranking_info.get('ranking')
-                    )
+                blog_entry = existing_today
+                action = "updated"
+            else:
+                # 새로운 데이터 추가 (다른 날짜이거나 같은 날짜에 데이터가 없는 경우)
+                blog_entry = models.CampaignBlog(
+                    campaign_id=campaign.id,
+                    campaign_url=schedule.campaign_url,
+                    username=blog_data.get('username'),
+                    title=blog_data.get('title'),
+                    likes_count=blog_data.get('likes_count', 0),
+                    comments_count=blog_data.get('comments_count', 0),
+                    daily_visitors=blog_data.get('daily_visitors', 0),
+                    product=campaign.product,
+                    posted_at=blog_data.get('posted_at'),
+                    collection_date=collection_date
                 )
-
-            for keyword in keywords:
-                if keyword and keyword not in ranking_keywords:
-                    ranking_records.append(
-                        models.CampaignBlogRanking(
-                            keyword=keyword,
-                            ranking=None
-                        )
-                    )
-
-            if ranking_records:
-                base_entry.rankings.extend(ranking_records)
-
-            self.db.add(base_entry)
-
-            # 커밋은 상위 메서드에서 처리하므로 여기서는 flush만 수행
-            self.db.flush()
-            print(f"✅ Successfully saved blog data to database:")
-            print(f"   - Title: {base_entry.title}")
-            print(f"   - Username: {base_entry.username}")
-            print(f"   - Likes: {base_entry.likes_count}")
-            print(f"   - Comments: {base_entry.comments_count}")
-            print(f"   - Daily Visitors: {base_entry.daily_visitors}")
-            print(f"   - Rankings: {len(ranking_records)} keywords")
-            print(f"✅ Collected blog data for campaign {campaign.name}")
+                db.add(blog_entry)
+                action = "saved"
+
+            # 커밋은 상위 메서드에서 처리하므로 여기서는 flush 후 랭킹만 추가
+            await self._run_db(self._flush_blog_rankings, blog_entry, ranking_rows, db)
+
+            logger.info(f"✅ Successfully {action} blog data in database:")
+            logger.debug(f"   - Title: {blog_entry.title}")
+            logger.debug(f"   - Username: {blog_entry.username}")
+            logger.debug(f"   - Likes: {blog_entry.likes_count}")
+            logger.debug(f"   - Comments: {blog_entry.comments_count}")
+            logger.debug(f"   - Daily Visitors: {blog_entry.daily_visitors}")
+            logger.debug(f"   - Rankings: {len(ranking_rows)} keywords")
+            logger.info(f"✅ Collected blog data for campaign {campaign.name}")
             
         except Exception as e:
-            import traceback
-            print(f"❌ Error collecting campaign blogs: {str(e)}")
-            traceback.print_exc()
-            self.db.rollback()
-
-    def _calculate_influencer_average_views(self, username: str) -> Optional[float]:
-        profile = (
-            self.db.query(models.InfluencerProfile)
-            .filter(models.InfluencerProfile.username == username)
-            .first()
-        )
-        if not profile:
-            return None
+            logger.exception(f"❌ Error collecting campaign blogs: {str(e)}")
+            raise
 
-        view_counts = [
-            row[0]
-            for row in self.db.query(models.InfluencerReel.video_play_count)
-            .filter(
-                models.InfluencerReel.profile_id == profile.id,
-                models.InfluencerReel.video_play_count.isnot(None),
+    @staticmethod
+    def _flush_blog_rankings(blog_entry: models.CampaignBlog, ranking_rows: List[dict], db: Session) -> None:
+        """블로그 행을 flush해 id를 확보한 뒤 랭킹 데이터를 한 번의 executemany INSERT로 추가"""
+        db.flush()
+        if ranking_rows:
+            db.execute(
+                insert(models.CampaignBlogRanking),
+                [dict(row, campaign_blog_id=blog_entry.id) for row in ranking_rows]
             )
-            .all()
-            if row[0] is not None
-        ]
 
-        if not view_counts:
-            return None
-
-        view_counts.sort()
-        if len(view_counts) > 4:
-            trimmed = view_counts[2:-2]
-            if not trimmed:
-                trimmed = view_counts
-        else:
-            trimmed = view_counts
-
-        if not trimmed:
-            return None
-
-        return sum(trimmed) / len(trimmed)
-
-    def _determine_influencer_grade(self, username: str) -> Optional[str]:
-        average_views = self._calculate_influencer_average_views(username)
-        if average_views is None:
-            return None
-        return instagram_grade_service.get_grade_for_average(self.db, average_views)
-    
-    def _get_grade_from_followers(self, follower_count: int) -> str:
-        """팔로워 수에 따른 기본 등급 분류"""
-        if follower_count >= 100000:
-            return "A"
-        elif follower_count >= 10000:
-            return "B"
-        elif follower_count > 0:
-            return "C"
-        else:
-            return "등급 없음"
-    
-    def _get_grade_from_views(self, view_count: int) -> str:
-        """조회수에 따른 등급 분류 (instagram_grade_thresholds 테이블 기반)"""
-        try:
-            # 데이터베이스에서 등급 임계값 조회
-            thresholds = self.db.query(models.InstagramGradeThreshold).order_by(
-                models.InstagramGradeThreshold.min_view_count.desc()
-            ).all()
-            
-            for threshold in thresholds:
-                if view_count >= threshold.min_view_count:
-                    if threshold.max_view_count is None or view_count <= threshold.max_view_count:
-                        return threshold.grade_name
-            
-            # 어떤 임계값도 맞지 않으면 기본값
-            return "등급 없음"
-            
-        except Exception as e:
-            print(f"등급 계산 오류: {e}")
-            return "등급 없음"
-
-    async def _generate_campaign_keywords(self, campaign_id: int, new_title: Optional[str]) -> List[str]:
+    async def _generate_campaign_keywords(self, campaign_id: int, new_title: Optional[str], db: Session) -> List[str]:
         """캠페인 전체 제목을 기반으로 GPT를 활용해 핵심 키워드를 도출합니다."""
-        titles_query = self.db.query(models.CampaignBlog.title).filter(
-            models.CampaignBlog.campaign_id == campaign_id
-        )
-        titles = [row[0] for row in titles_query if row and row[0]]
+        titles_query = db.query(models.CampaignBlog.title).filter(
+            models.CampaignBlog.campaign_id == campaign_id,
+            models.CampaignBlog.title.isnot(None)
+        ).distinct()
+        titles = [row[0] for row in await self._run_db(titles_query.all) if row[0]]
         if new_title:
             titles.append(new_title)
 
-        unique_titles: List[str] = []
-        for title in titles:
-            normalized = title.strip() if title else ""
-            if normalized and normalized not in unique_titles:
-                unique_titles.append(normalized)
+        # 입력 순서를 유지하며 중복 제거 (dict 키는 삽입 순서 유지)
+        unique_titles: List[str] = list(dict.fromkeys(filter(None, (title.strip() for title in titles))))
 
         if not unique_titles:
             return []
@@ -622,7 +853,7 @@ class SchedulerService:
                 if keywords:
                     return keywords
             except Exception as exc:  # noqa: BLE001
-                print(f"Error generating keywords with OpenAI: {exc}")
+                logger.warning(f"Error generating keywords with OpenAI: {exc}")
 
         return self._fallback_keywords(unique_titles)
 
@@ -630,10 +861,8 @@ class SchedulerService:
     def _fallback_keywords(titles: List[str], limit: int = 5) -> List[str]:
         counter: Counter[str] = Counter()
         for title in titles:
-            tokens = re.findall(r'[가-힣a-zA-Z0-9]+', title or '')
-            for token in tokens:
-                if len(token) >= 2:
-                    counter[token] += 1
+            if title:
+                counter.update(_TOKEN_RE.findall(title))
         return [kw for kw, _ in counter.most_common(limit)]
 
 # Lazy initialization to avoid DB connection during module import
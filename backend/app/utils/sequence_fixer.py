@@ -3,16 +3,47 @@ PostgreSQL 시퀀스 자동 복구 유틸리티
 UniqueViolation 에러 발생 시 자동으로 시퀀스를 리셋합니다.
 """
 import logging
+import re
+from functools import lru_cache
 from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
+# 테이블 이름은 바인딩할 수 없어 SQL에 직접 넣으므로 소문자 식별자만 허용
+_TABLE_NAME_RE = re.compile(r'[a-z_][a-z0-9_]*')
+
+_SETVAL_SQL = text("SELECT setval(:seq, :val, false)")
+
+# 시퀀스를 리셋할 주요 테이블 (fix_all_sequences와 fix_sequences.py 스크립트가 공유)
+SEQUENCE_TABLES = (
+    'influencer_analysis',
+    'influencer_profiles',
+    'influencer_reels',
+    'influencer_posts',
+    'influencer_classification_summaries',
+    'classification_jobs',
+    'collection_jobs',
+    'campaigns',
+    'campaign_urls',
+    'campaign_instagram_reels',
+    'campaign_blogs',
+)
+
+
+def validate_table_name(table_name: str) -> str:
+    """SQL에 직접 넣을 테이블 이름 검증 (허용되지 않는 이름이면 ValueError)"""
+    if not _TABLE_NAME_RE.fullmatch(table_name):
+        raise ValueError(f"허용되지 않는 테이블 이름입니다: {table_name!r}")
+    return table_name
+
 
 def fix_table_sequence(db: Session, table_name: str) -> bool:
     """
     특정 테이블의 시퀀스를 현재 최대 ID + 1로 리셋합니다.
+    시퀀스가 이미 최대 ID 이상이면 setval 없이 성공으로 처리합니다.
     
     Args:
         db: SQLAlchemy 세션
@@ -22,24 +53,9 @@ def fix_table_sequence(db: Session, table_name: str) -> bool:
         성공 여부
     """
     try:
-        # 현재 최대 ID 조회
-        result = db.execute(text(f"SELECT MAX(id) FROM {table_name}"))
-        max_id = result.scalar()
-        
-        if max_id is None:
-            logger.warning(f"테이블 '{table_name}'이 비어있습니다")
-            return False
-        
-        # 시퀀스 이름 (일반적으로 tablename_id_seq)
-        sequence_name = f"{table_name}_id_seq"
-        
-        # 시퀀스를 최대 ID + 1로 설정
-        new_value = max_id + 1
-        db.execute(text(f"SELECT setval('{sequence_name}', {new_value}, false)"))
+        success = _reset_table_sequence(db, table_name)
         db.commit()
-        
-        logger.info(f"✅ '{table_name}' 시퀀스를 {new_value}로 리셋했습니다 (최대 ID: {max_id})")
-        return True
+        return success
         
     except Exception as e:
         logger.error(f"❌ '{table_name}' 시퀀스 리셋 실패: {str(e)}")
@@ -47,6 +63,59 @@ def fix_table_sequence(db: Session, table_name: str) -> bool:
         return False
 
 
+def _reset_table_sequence(db: Session, table_name: str) -> bool:
+    """
+    fix_table_sequence의 커밋/롤백 없는 본체 (진행 중인 트랜잭션 안에서 호출 가능)
+    
+    setval은 트랜잭션과 무관하게 즉시 반영되므로 커밋하지 않아도 시퀀스는 바뀝니다.
+    쿼리 실패 시 예외를 그대로 전달합니다.
+    """
+    validate_table_name(table_name)
+    
+    # 현재 최대 ID, id 컬럼의 시퀀스 이름(카탈로그 기준), 시퀀스의 마지막 값을 함께 조회
+    # (last_value는 시퀀스를 아직 사용하지 않았거나 setval(..., false) 직후면 NULL)
+    max_id, sequence_name, last_value = db.execute(
+        _sequence_state_sql(table_name),
+        {"tbl": table_name}
+    ).one()
+    
+    if sequence_name is None:
+        logger.warning(f"테이블 '{table_name}'의 id 컬럼에 연결된 시퀀스가 없습니다")
+        return False
+    
+    if max_id is None:
+        logger.warning(f"테이블 '{table_name}'이 비어있습니다")
+        return False
+    
+    # 시퀀스가 이미 최대 ID 이상이면 다음 값이 중복되지 않으므로 리셋 불필요
+    if last_value is not None and last_value >= max_id:
+        logger.info(f"✅ '{table_name}' 시퀀스가 이미 최신입니다 (시퀀스: {last_value}, 최대 ID: {max_id})")
+        return True
+    
+    # 시퀀스를 최대 ID + 1로 설정
+    new_value = max_id + 1
+    db.execute(_SETVAL_SQL, {"seq": sequence_name, "val": new_value})
+    
+    logger.info(f"✅ '{table_name}' 시퀀스를 {new_value}로 리셋했습니다 (최대 ID: {max_id})")
+    return True
+
+
+@lru_cache(maxsize=64)
+def _sequence_state_sql(table_name: str):
+    """테이블별 (MAX(id), 시퀀스 이름, last_value) 조회문 - 테이블 이름만 다르므로 테이블당 한 번만 생성"""
+    return text(
+        f"SELECT (SELECT MAX(id) FROM {table_name}), seq, "
+        f"pg_sequence_last_value(seq::regclass) "
+        f"FROM pg_get_serial_sequence(:tbl, 'id') AS seq"
+    )
+
+
+@lru_cache(maxsize=8)
+def _batch_reset_sql(tables: tuple):
+    """build_batch_reset_sql 결과를 text로 캐시 (테이블 목록이 같으면 재사용)"""
+    return text(build_batch_reset_sql(tables))
+
+
 def auto_fix_sequence_on_error(db: Session, error: Exception, table_name: str) -> bool:
     """
     UniqueViolation 에러 발생 시 자동으로 시퀀스를 리셋합니다.
@@ -59,35 +128,87 @@ def auto_fix_sequence_on_error(db: Session, error: Exception, table_name: str) -
     Returns:
         시퀀스 리셋 성공 여부
     """
-    error_str = str(error)
-    
-    # UniqueViolation 에러인지 확인
-    if "UniqueViolation" in error_str or "duplicate key" in error_str:
-        # Primary key constraint 에러인지 확인
-        if f"{table_name}_pkey" in error_str or "Key (id)=" in error_str:
-            logger.warning(f"⚠️ '{table_name}'에서 ID 중복 에러 감지 - 시퀀스 자동 리셋 시도")
-            
-            # 세션 롤백
-            db.rollback()
-            
-            # 시퀀스 리셋 시도
-            if fix_table_sequence(db, table_name):
-                logger.info(f"✅ '{table_name}' 시퀀스 자동 리셋 완료")
-                return True
-            else:
-                logger.error(f"❌ '{table_name}' 시퀀스 자동 리셋 실패")
-                return False
+    if _is_primary_key_violation(error, table_name):
+        logger.warning(f"⚠️ '{table_name}'에서 ID 중복 에러 감지 - 시퀀스 자동 리셋 시도")
+        
+        # 세션 롤백
+        db.rollback()
+        
+        # 시퀀스 리셋 시도
+        if fix_table_sequence(db, table_name):
+            logger.info(f"✅ '{table_name}' 시퀀스 자동 리셋 완료")
+            return True
+        else:
+            logger.error(f"❌ '{table_name}' 시퀀스 자동 리셋 실패")
+            return False
     
     return False
 
 
+def _is_primary_key_violation(error: Exception, table_name: str) -> bool:
+    """테이블의 id(Primary key) 중복으로 인한 UniqueViolation인지 확인
+
+    에러 메시지 문자열 대신 psycopg2 예외의 SQLSTATE와 제약조건 이름으로 판별하므로
+    같은 테이블의 다른 유니크 인덱스 위반은 시퀀스 문제로 오인하지 않습니다.
+    """
+    if not isinstance(error, IntegrityError):
+        return False
+    
+    orig = error.orig
+    # 23505: unique_violation
+    if getattr(orig, "pgcode", None) != "23505":
+        return False
+    
+    diag = getattr(orig, "diag", None)
+    return getattr(diag, "constraint_name", None) == f"{table_name}_pkey"
+
+
+def insert_with_sequence_recovery(db: Session, model, values: dict) -> int:
+    """
+    INSERT ... ON CONFLICT (id) DO NOTHING으로 행을 추가하고 새 id를 반환합니다.
+    
+    시퀀스가 뒤처져 id가 겹치면 예외 없이 삽입만 건너뛰므로, 트랜잭션을 롤백하지 않고
+    같은 트랜잭션 안에서 시퀀스를 리셋한 뒤 한 번 더 시도합니다.
+    
+    Args:
+        db: SQLAlchemy 세션
+        model: id 컬럼을 가진 ORM 모델
+        values: 삽입할 컬럼 값
+    
+    Returns:
+        삽입된 행의 id
+    
+    Raises:
+        RuntimeError: 시퀀스 리셋 후에도 id가 겹치는 경우
+    """
+    stmt = (
+        pg_insert(model)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=['id'])
+        .returning(model.id)
+    )
+    new_id = db.execute(stmt).scalar()
+    if new_id is None:
+        table_name = model.__tablename__
+        logger.warning(f"⚠️ '{table_name}'에서 ID 중복 감지 - 시퀀스 리셋 후 재시도")
+        _reset_table_sequence(db, table_name)
+        new_id = db.execute(stmt).scalar()
+        if new_id is None:
+            raise RuntimeError(f"'{table_name}' 시퀀스 리셋 후에도 ID가 중복됩니다")
+    return new_id
+
+
 def safe_db_operation(db: Session, operation_func, table_name: str, max_retries: int = 2):
     """
     DB 작업을 안전하게 수행하고, UniqueViolation 에러 발생 시 자동으로 복구합니다.
     
+    operation_func는 SAVEPOINT 안에서 실행되며 커밋하지 않고 flush까지만 수행해야 합니다.
+    ID 중복이 발생하면 해당 SAVEPOINT만 되돌리고 같은 트랜잭션 안에서 시퀀스를 리셋한 뒤
+    operation_func만 다시 실행하며, 성공하면 한 번 커밋합니다.
+    
     Args:
         db: SQLAlchemy 세션
-        operation_func: 실행할 DB 작업 함수
+        operation_func: 실행할 DB 작업 함수 (커밋하지 않음)
         table_name: 작업 대상 테이블 이름
         max_retries: 최대 재시도 횟수
     
@@ -101,28 +222,37 @@ def safe_db_operation(db: Session, operation_func, table_name: str, max_retries:
     
     for attempt in range(max_retries + 1):
         try:
-            result = operation_func()
+            # SAVEPOINT 종료 시 flush되며, 실패하면 SAVEPOINT까지만 롤백됨
+            with db.begin_nested():
+                result = operation_func()
+            db.commit()
             return result
             
         except IntegrityError as e:
             last_error = e
             
-            # 첫 번째 시도가 아니면 더 이상 재시도하지 않음
-            if attempt >= max_retries:
-                logger.error(f"❌ '{table_name}' 작업 최종 실패 (재시도 {max_retries}회)")
+            # ID 중복이 아니거나 재시도 횟수를 모두 쓰면 트랜잭션 전체를 롤백하고 예외 발생
+            if attempt >= max_retries or not _is_primary_key_violation(e, table_name):
+                if attempt >= max_retries:
+                    logger.error(f"❌ '{table_name}' 작업 최종 실패 (재시도 {max_retries}회)")
+                db.rollback()
                 raise
             
-            # UniqueViolation 자동 복구 시도
-            if auto_fix_sequence_on_error(db, e, table_name):
-                logger.info(f"🔄 '{table_name}' 작업 재시도 중 (시도 {attempt + 2}/{max_retries + 1})")
-                continue
-            else:
-                # 복구 실패하면 바로 예외 발생
-                raise
+            logger.warning(f"⚠️ '{table_name}'에서 ID 중복 에러 감지 - 시퀀스 자동 리셋 시도")
+            try:
+                with db.begin_nested():
+                    _reset_table_sequence(db, table_name)
+            except Exception as reset_error:
+                logger.error(f"❌ '{table_name}' 시퀀스 자동 리셋 실패: {str(reset_error)}")
+                db.rollback()
+                raise e
+            
+            logger.info(f"🔄 '{table_name}' 작업 재시도 중 (시도 {attempt + 2}/{max_retries + 1})")
         
         except Exception as e:
             # IntegrityError가 아닌 다른 에러는 바로 발생
             logger.error(f"❌ '{table_name}' 작업 중 예상치 못한 에러: {str(e)}")
+            db.rollback()
             raise
     
     # 모든 재시도 실패
@@ -130,6 +260,27 @@ def safe_db_operation(db: Session, operation_func, table_name: str, max_retries:
         raise last_error
 
 
+def build_batch_reset_sql(tables: list) -> str:
+    """
+    여러 테이블의 시퀀스를 MAX(id) + 1로 리셋하는 단일 SQL을 만듭니다.
+    
+    테이블별 SELECT를 UNION ALL로 묶어 (table_name, max_id, new_value) 행을 반환합니다.
+    시퀀스 이름은 이름 규칙으로 추측하지 않고 pg_get_serial_sequence로 같은 쿼리 안에서 조회합니다.
+    시퀀스의 last_value가 이미 MAX(id) 이상이면 setval을 실행하지 않고 new_value가 NULL이며,
+    빈 테이블은 max_id와 new_value가 모두 NULL입니다.
+    """
+    for table in tables:
+        validate_table_name(table)
+    return "\nUNION ALL\n".join(
+        f"SELECT '{table}' AS table_name, MAX(id) AS max_id, "
+        f"CASE WHEN MAX(id) > COALESCE("
+        f"pg_sequence_last_value(pg_get_serial_sequence('{table}', 'id')::regclass), 0) "
+        f"THEN setval(pg_get_serial_sequence('{table}', 'id'), MAX(id) + 1, false) "
+        f"END AS new_value FROM {table}"
+        for table in tables
+    )
+
+
 # 자주 사용하는 테이블들의 시퀀스를 한 번에 리셋
 def fix_all_sequences(db: Session) -> dict:
     """
@@ -138,26 +289,41 @@ def fix_all_sequences(db: Session) -> dict:
     Returns:
         {table_name: success_bool} 형태의 딕셔너리
     """
-    tables = [
-        'influencer_analysis',
-        'influencer_profiles',
-        'influencer_reels',
-        'influencer_posts',
-        'influencer_classification_summaries',
-        'classification_jobs',
-        'collection_jobs',
-        'campaigns',
-        'campaign_urls',
-        'campaign_instagram_reels',
-        'campaign_blogs',
-    ]
+    tables = SEQUENCE_TABLES
     
+    try:
+        # 모든 테이블의 MAX(id) 조회와 setval을 한 번의 쿼리로 실행 (테이블마다 왕복하지 않음)
+        rows = db.execute(_batch_reset_sql(tables)).all()
+        db.commit()
+    except Exception as e:
+        # 일부 테이블이 없는 등 일괄 실행이 실패하면 테이블별로 다시 시도
+        logger.warning(f"시퀀스 일괄 리셋 실패, 테이블별로 재시도합니다: {str(e)}")
+        db.rollback()
+        results = {table: fix_table_sequence(db, table) for table in tables}
+        success_count = sum(1 for v in results.values() if v)
+        logger.info(f"✅ 시퀀스 리셋 완료: {success_count}/{len(tables)} 테이블")
+        return results
+    
+    # 테이블별 결과는 모아서 요약 로그 한 줄로 출력
     results = {}
-    for table in tables:
-        results[table] = fix_table_sequence(db, table)
+    reset_tables = []
+    up_to_date_tables = []
+    empty_tables = []
+    for table_name, max_id, new_value in rows:
+        if max_id is None:
+            empty_tables.append(table_name)
+            results[table_name] = False
+        elif new_value is None:
+            up_to_date_tables.append(table_name)
+            results[table_name] = True
+        else:
+            reset_tables.append(f"{table_name}={new_value}")
+            results[table_name] = True
     
-    success_count = sum(1 for v in results.values() if v)
-    logger.info(f"✅ 시퀀스 리셋 완료: {success_count}/{len(tables)} 테이블")
+    logger.info(
+        f"✅ 시퀀스 리셋 완료: {len(reset_tables) + len(up_to_date_tables)}/{len(tables)} 테이블 "
+        f"(리셋: {reset_tables}, 최신: {up_to_date_tables}, 빈 테이블: {empty_tables})"
+    )
     
     return results
 
@@ -12,19 +12,13 @@ import sys
 import os
 import asyncio
 from pathlib import Path
-from datetime import datetime, timedelta
 
 # Add the backend directory to Python path
 backend_dir = Path(__file__).parent
 sys.path.append(str(backend_dir))
 
-from app.services.scheduler_service import scheduler_service
-
-KST_OFFSET = timedelta(hours=9)
-
-def now_kst() -> datetime:
-    """한국 시간(KST) 기준 현재 시간 반환"""
-    return datetime.utcnow() + KST_OFFSET
+from app.core.logging_config import setup_logging
+from app.services.scheduler_service import now_kst, scheduler_service
 
 async def main():
     """Cron job main function - 매 시간마다 실행하여 각 스케줄의 설정된 시간에 맞는 것만 처리"""
@@ -33,12 +27,14 @@ async def main():
         print(f"=== Cron Job Check at {kst_now.strftime('%Y-%m-%d %H:%M:%S')} (KST) ===")
         
         # 매 시간마다 실행 (스케줄러 내부에서 각 스케줄의 시간을 체크)
+        # 위에서 확인한 시각의 hour를 넘겨 로그와 스케줄 매칭이 같은 시각을 기준으로 하도록 함
         print("=== Goodwave Data Collection Cron Job Started ===")
-        await scheduler_service.run_scheduled_collection()
+        await scheduler_service.run_scheduled_collection(run_hour=kst_now.hour)
         print("=== Goodwave Data Collection Cron Job Completed ===")
     except Exception as e:
         print(f"=== Cron Job Error: {str(e)} ===")
         sys.exit(1)
 
 if __name__ == "__main__":
+    setup_logging()
     asyncio.run(main())
\ No newline at end of file
@@ -7,8 +7,15 @@ import sys
 from app.db.database import SessionLocal
 from app.db import models
 
-def fix_campaign_names():
-    """모든 캠페인 이름에서 불필요한 공백 문자 제거"""
+# 이름에서 제거할 제어 문자 (탭, 줄바꿈, 캐리지 리턴)
+_CONTROL_CHARS_TABLE = str.maketrans('', '', '\t\n\r')
+
+def fix_campaign_names(verbose: bool = False):
+    """모든 캠페인 이름에서 불필요한 공백 문자 제거
+
+    Args:
+        verbose: True면 수정한 이름의 길이/UTF-8 바이트까지 출력
+    """
     db = SessionLocal()
     
     try:
@@ -19,19 +26,21 @@ def fix_campaign_names():
         
         for campaign in campaigns:
             original_name = campaign.name
-            # 탭, 줄바꿈, 캐리지 리턴 제거 후 양쪽 공백 제거
-            cleaned_name = original_name.strip().replace('\t', '').replace('\n', '').replace('\r', '')
+            # 탭, 줄바꿈, 캐리지 리턴을 한 번에 제거 후 양쪽 공백 제거
+            cleaned_name = original_name.translate(_CONTROL_CHARS_TABLE).strip()
             
             if original_name != cleaned_name:
                 print(f"🔧 수정: '{original_name}' → '{cleaned_name}'")
-                print(f"   원본 길이: {len(original_name)}, 수정 길이: {len(cleaned_name)}")
-                print(f"   원본 바이트: {original_name.encode('utf-8')}")
-                print(f"   수정 바이트: {cleaned_name.encode('utf-8')}")
+                if verbose:
+                    print(f"   원본 길이: {len(original_name)}, 수정 길이: {len(cleaned_name)}")
+                    print(f"   원본 바이트: {original_name.encode('utf-8')}")
+                    print(f"   수정 바이트: {cleaned_name.encode('utf-8')}")
                 
                 campaign.name = cleaned_name
                 fixed_count += 1
-            else:
-                print(f"✅ 정상: '{original_name}'")
+        
+        # 정상 캠페인은 건별로 출력하지 않고 개수만 요약
+        print(f"✅ 정상: {len(campaigns) - fixed_count}개")
         
         if fixed_count > 0:
             db.commit()
@@ -49,5 +58,5 @@ def fix_campaign_names():
         db.close()
 
 if __name__ == "__main__":
-    fix_campaign_names()
+    fix_campaign_names(verbose="--verbose" in sys.argv[1:])
 
@@ -3,9 +3,12 @@ PostgreSQL 시퀀스 리셋 스크립트
 ID 중복 오류를 해결하기 위해 모든 테이블의 시퀀스를 현재 최대 ID + 1로 리셋합니다.
 """
 import os
+from concurrent.futures import ThreadPoolExecutor
 from sqlalchemy import create_engine, text
 from dotenv import load_dotenv
 
+from app.utils.sequence_fixer import SEQUENCE_TABLES, build_batch_reset_sql, validate_table_name
+
 load_dotenv()
 
 # 데이터베이스 연결
@@ -16,45 +19,36 @@ if not DATABASE_URL:
 
 engine = create_engine(DATABASE_URL)
 
-# 시퀀스를 리셋할 테이블 목록
-TABLES_TO_FIX = [
-    'influencer_analysis',
-    'influencer_profiles',
-    'influencer_reels',
-    'influencer_posts',
-    'influencer_classification_summaries',
-    'classification_jobs',
-    'collection_jobs',
-    'campaigns',
-    'campaign_urls',
-    'campaign_instagram_reels',
-    'campaign_blogs',
-]
+# 시퀀스를 리셋할 테이블 목록 (앱의 fix_all_sequences와 같은 목록 사용)
+TABLES_TO_FIX = SEQUENCE_TABLES
+
+def fix_sequence(table_name: str) -> str:
+    """특정 테이블의 시퀀스를 리셋하고 결과 메시지를 반환합니다.
 
-def fix_sequence(table_name: str):
-    """특정 테이블의 시퀀스를 리셋합니다."""
+    테이블마다 별도 커넥션을 사용하므로 여러 테이블을 동시에 실행할 수 있습니다.
+    """
     try:
+        validate_table_name(table_name)
         with engine.connect() as conn:
             # 현재 최대 ID 조회
             result = conn.execute(text(f"SELECT MAX(id) FROM {table_name}"))
             max_id = result.scalar()
             
             if max_id is None:
-                print(f"⚠️  {table_name}: 테이블이 비어있습니다 (스킵)")
-                return
+                return f"⚠️  {table_name}: 테이블이 비어있습니다 (스킵)"
             
-            # 시퀀스 이름 (일반적으로 tablename_id_seq)
-            sequence_name = f"{table_name}_id_seq"
-            
-            # 시퀀스를 최대 ID + 1로 설정
+            # 시퀀스를 최대 ID + 1로 설정 (시퀀스 이름은 카탈로그에서 조회)
             new_value = max_id + 1
-            conn.execute(text(f"SELECT setval('{sequence_name}', {new_value}, false)"))
+            conn.execute(
+                text("SELECT setval(pg_get_serial_sequence(:tbl, 'id'), :val, false)"),
+                {"tbl": table_name, "val": new_value}
+            )
             conn.commit()
             
-            print(f"✅ {table_name}: 시퀀스를 {new_value}로 리셋했습니다 (현재 최대 ID: {max_id})")
+            return f"✅ {table_name}: 시퀀스를 {new_value}로 리셋했습니다 (현재 최대 ID: {max_id})"
             
     except Exception as e:
-        print(f"❌ {table_name}: 오류 발생 - {str(e)}")
+        return f"❌ {table_name}: 오류 발생 - {str(e)}"
 
 def main():
     print("=" * 60)
@@ -62,8 +56,24 @@ def main():
     print("=" * 60)
     print()
     
-    for table_name in TABLES_TO_FIX:
-        fix_sequence(table_name)
+    # 모든 테이블을 한 번의 쿼리로 리셋하고, 실패하면 테이블별로 다시 시도
+    try:
+        with engine.connect() as conn:
+            rows = conn.execute(text(build_batch_reset_sql(TABLES_TO_FIX))).all()
+            conn.commit()
+        for table_name, max_id, new_value in rows:
+            if max_id is None:
+                print(f"⚠️  {table_name}: 테이블이 비어있습니다 (스킵)")
+            elif new_value is None:
+                print(f"✅ {table_name}: 시퀀스가 이미 최신입니다 (현재 최대 ID: {max_id})")
+            else:
+                print(f"✅ {table_name}: 시퀀스를 {new_value}로 리셋했습니다 (현재 최대 ID: {max_id})")
+    except Exception as e:
+        print(f"⚠️  일괄 리셋 실패, 테이블별로 재시도합니다: {str(e)}")
+        # 테이블별 왕복을 순차로 기다리지 않도록 커넥션 풀 크기(기본 5) 안에서 동시에 실행
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for message in executor.map(fix_sequence, TABLES_TO_FIX):
+                print(message)
     
     print()
     print("=" * 60)
@@ -1,283 +1,452 @@
-import time
+import asyncio
 import json
-import requests
+import logging
+import random
+import re
+import threading
+import weakref
+import aiohttp
+import orjson
 from dotenv import load_dotenv
+from functools import lru_cache
+from pathlib import Path
 import os
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# 연결/읽기 단위 타임아웃 (기존 requests의 timeout=30과 같은 의미, 전체 다운로드 시간은 제한하지 않음)
+_HTTP_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=30)
+
+# 스냅샷 파일 동시 다운로드 수
+_DOWNLOAD_CONCURRENCY = 8
+
+# 스냅샷 파일 URL 형식 검사 (http/https)
+_is_http_url = re.compile(r"https?://", re.IGNORECASE).match
+
+
+_BRIGHTDATA_CONFIG_PATH = Path(__file__).parent / "brightdata.json"
+
+
+@lru_cache(maxsize=1)
+def _load_brightdata_config():
+    """brightdata.json은 프로세스당 한 번만 읽어 재사용"""
+    with open(_BRIGHTDATA_CONFIG_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def _campaign_params_template(kind):
+    """캠페인용 BrightData params 템플릿 (type과 discover_by 제거) - 호출 측에서 복사해 사용"""
+    params = dict(_load_brightdata_config().get("instagram", {}).get(kind, {}).get("params", {}))
+    params.pop("type", None)
+    params.pop("discover_by", None)
+    return params
+
+
+def _backoff_delay(attempt, max_interval, base=1.0):
+    """스냅샷 상태 재확인 대기 시간 - base부터 두 배씩 늘려 max_interval로 제한하고 지터 적용
+
+    동시에 끝난 여러 스냅샷이 같은 시점에 몰려 재확인하지 않도록 [delay/2, delay] 구간에서 무작위로 선택.
+    """
+    delay = min(max_interval, base * 2 ** attempt)
+    return random.uniform(delay / 2, delay)
+
+
+def _query_params(params):
+    """aiohttp는 bool 쿼리 값을 허용하지 않으므로 문자열로 변환 (brightdata.json과 같은 소문자 표기)"""
+    return {key: (str(value).lower() if isinstance(value, bool) else value) for key, value in params.items()}
+
+
 class Instagram:
     def __init__(self):
         """Instagram 데이터 수집 클래스 초기화"""
         self.api_key = os.getenv("BRIGHTDATA_API_KEY")
         if not self.api_key:
             raise ValueError("BRIGHTDATA_API_KEY 환경변수가 설정되지 않았습니다.")
+        # 이벤트 루프별 BrightData HTTP 세션 (루프 안에서 최초 요청 시 생성)
+        # 같은 인스턴스를 FastAPI 루프와 스케줄러 스레드 루프가 함께 쓰므로 루프마다 따로 두고,
+        # 각 세션은 자기 루프에서만 닫음 (다른 루프에서 사용 중인 세션을 닫지 않도록)
+        self._sessions = weakref.WeakKeyDictionary()
+        self._sessions_lock = threading.Lock()
+        # snapshot_id별 진행 중인 상태 조회 Task - 동시에 같은 스냅샷을 기다리는 호출이 요청을 공유
+        self._status_requests = {}
+    
+    async def __aenter__(self):
+        self._get_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """현재 이벤트 루프의 인증 헤더가 설정된 ClientSession 반환 (없거나 닫혔으면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        with self._sessions_lock:
+            session = self._sessions.get(loop)
+            if session is None or session.closed:
+                self._release_dead_loop_sessions()
+                session = aiohttp.ClientSession(
+                    # 스냅샷 JSON은 압축률이 높으므로 gzip 응답을 명시적으로 요청 (aiohttp가 자동 해제)
+                    headers={"Authorization": f"Bearer {self.api_key}", "Accept-Encoding": "gzip, deflate"},
+                    timeout=_HTTP_TIMEOUT
+                )
+                self._sessions[loop] = session
+            return session
     
-    def trigger_snapshot_request(self, dataset_id, params, data):
+    async def close(self):
+        """현재 이벤트 루프의 HTTP 세션 종료 (다른 루프에서 실행 중인 세션은 그 루프가 직접 닫음)"""
+        loop = asyncio.get_running_loop()
+        with self._sessions_lock:
+            session = self._sessions.pop(loop, None)
+            self._release_dead_loop_sessions()
+        if session is not None and not session.closed:
+            await session.close()
+
+    def _release_dead_loop_sessions(self):
+        """이미 종료된 루프에 남은 세션 정리 (_sessions_lock을 잡은 상태에서 호출)
+
+        닫힌 루프에서는 close 코루틴을 실행할 수 없으므로 세션을 분리한 뒤 커넥터만 닫음.
+        """
+        for loop in [loop for loop in self._sessions if loop.is_closed()]:
+            session = self._sessions.pop(loop)
+            if session.closed:
+                continue
+            connector = session.connector
+            session.detach()
+            if connector is not None:
+                try:
+                    connector.close()
+                except RuntimeError:  # 루프가 이미 닫혀 연결 종료를 예약할 수 없음
+                    pass
+    
+    async def trigger_snapshot_request(self, dataset_id, params, data):
         """스냅샷 수집 요청"""
         url = "https://api.brightdata.com/datasets/v3/trigger"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
         # BrightData 요청 형식: URL params + JSON body
-        url_params = {"dataset_id": dataset_id, **params}
-        response = requests.post(url, headers=headers, params=url_params, json=data)
-        
-        print(f"📡 BrightData API 응답 상태: {response.status_code}")
-        print(f"📋 응답 헤더: {dict(response.headers)}")
-        print(f"📄 응답 내용: {response.text[:500]}...")  # 첫 500자만 출력
+        url_params = _query_params({"dataset_id": dataset_id, **params})
+        async with self._get_session().post(url, params=url_params, json=data) as response:
+            status_code = response.status
+            response_text = await response.text()
+            # 헤더 복사와 본문 앞부분 슬라이스는 DEBUG 로그를 볼 때만 수행
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📡 BrightData API 응답 상태: %s", status_code)
+                logger.debug("📋 응답 헤더: %s", dict(response.headers))
+                logger.debug("📄 응답 내용: %s...", response_text[:500])  # 첫 500자만 출력
         
         # 상태 코드 확인
-        if response.status_code != 200:
-            print(f"❌ BrightData API 요청 실패: HTTP {response.status_code}")
-            print(f"📄 에러 응답: {response.text}")
-            raise Exception(f"BrightData API 요청 실패: HTTP {response.status_code} - {response.text}")
+        if status_code != 200:
+            logger.error("❌ BrightData API 요청 실패: HTTP %s", status_code)
+            logger.error("📄 에러 응답: %s", response_text)
+            raise Exception(f"BrightData API 요청 실패: HTTP {status_code} - {response_text}")
 
         try:
-            result = response.json()
+            result = orjson.loads(response_text)
             snapshot_id = result.get("snapshot_id")
             if not snapshot_id:
-                print(f"❌ snapshot_id를 찾을 수 없음: {result}")
+                logger.error("❌ snapshot_id를 찾을 수 없음: %s", result)
                 raise ValueError(f"snapshot_id not found in response: {result}")
-            print(f"✅ 스냅샷 ID 수신: {snapshot_id}")
+            logger.info("✅ 스냅샷 ID 수신: %s", snapshot_id)
             return snapshot_id
-        except requests.exceptions.JSONDecodeError as e:
-            print(f"❌ JSON 파싱 실패: {response.text[:200]}...")
-            raise Exception(f"Failed to parse trigger response as JSON. Response: {response.text[:200]}... Error: {str(e)}")
+        except orjson.JSONDecodeError as e:
+            logger.error("❌ JSON 파싱 실패: %s...", response_text[:200])
+            raise Exception(f"Failed to parse trigger response as JSON. Response: {response_text[:200]}... Error: {str(e)}")
 
-    def wait_for_snapshot(self, snapshot_id, data_type="profile", session_id=None):
+    async def wait_for_snapshot(self, snapshot_id, data_type="profile", session_id=None):
         """스냅샷 수집 완료 대기 및 데이터 위치 확인"""
         url = f"https://api.brightdata.com/datasets/v3/snapshot/{snapshot_id}"
-        headers = {"Authorization": f"Bearer {self.api_key}"}
         params = {"format": "json"}
+        
+        # 진행률 갱신 함수는 한 번만 가져와 재사용 (독립 실행 시 app 패키지가 없을 수 있어 필요할 때만 임포트)
+        update_progress = None
+        if session_id:
+            from app.services.progress_service import progress_service
+            update_progress = progress_service.update_progress
 
         # 데이터 타입별 최소 대기 시간 설정
         if data_type in ["posts", "reels"]:
             min_wait_time = 5    # 게시물/릴스는 5초 대기
             max_wait_time = 600  # 릴스는 최대 10분 (600초)
-            check_interval = 60  # 1분 간격
+            max_interval = 60    # 재확인 간격은 1초부터 두 배씩 늘려 최대 1분
         else:
             min_wait_time = 0    # 프로필은 즉시 확인 시작
             max_wait_time = 300  # 프로필은 최대 5분 (BrightData 서버 문제 대응)
-            check_interval = 10  # 10초 간격 (서버 부하 줄이기)
+            max_interval = 10    # 재확인 간격 최대 10초 (서버 부하 줄이기)
         
         wait_count = 0
+        poll_attempt = 0
+        had_error = False
+        # 처리 중(202) 진행률은 최소 대기 이후 경과 시간에 따라 30%에서 90%까지 증가
+        progress_scale = 60.0 / (max_wait_time - min_wait_time)
         
-        # 최소 대기 시간 확보
+        # 최소 대기 시간은 첫 상태 확인에서 아직 처리 중일 때만 적용 (이미 완료된 스냅샷은 바로 반환)
         if min_wait_time > 0:
-            print(f"📊 {data_type.upper()} 데이터 수집 중... 최소 {min_wait_time}초 대기")
-            if session_id:
-                from app.services.progress_service import progress_service
-                progress_service.update_progress(session_id, f"{data_type}_collection", 10, f"{data_type.title()} 데이터 처리 시작")
-            
-            time.sleep(min_wait_time)
-            wait_count += min_wait_time
-            
-            if session_id:
-                from app.services.progress_service import progress_service
-                progress_service.update_progress(session_id, f"{data_type}_collection", 30, f"{data_type.title()} 데이터 처리 중... ({wait_count}초 경과)")
+            logger.info("📊 %s 데이터 수집 중... 처리 중이면 최소 %s초 대기", data_type.upper(), min_wait_time)
+            if update_progress:
+                update_progress(session_id, f"{data_type}_collection", 10, f"{data_type.title()} 데이터 처리 시작")
         else:
-            print(f"📊 {data_type.upper()} 데이터 수집 중... 즉시 상태 확인 시작")
-            if session_id:
-                from app.services.progress_service import progress_service
-                progress_service.update_progress(session_id, f"{data_type}_collection", 20, f"{data_type.title()} 상태 확인 시작")
+            logger.info("📊 %s 데이터 수집 중... 즉시 상태 확인 시작", data_type.upper())
+            if update_progress:
+                update_progress(session_id, f"{data_type}_collection", 20, f"{data_type.title()} 상태 확인 시작")
         
         while wait_count < max_wait_time:
             try:
-                response = requests.get(url, headers=headers, params=params)
-                print(f"📡 {data_type.upper()} 상태 확인: {response.status_code} ({wait_count}초 경과)")
+                status_code, response_text = await self._get_snapshot_status(snapshot_id, url, params)
+                logger.debug("📡 %s 상태 확인: %s (%.0f초 경과)", data_type.upper(), status_code, wait_count)
 
-                if response.status_code == 202:
+                if status_code == 202:
+                    if had_error:
+                        poll_attempt = 0
+                        had_error = False
+                    delay = _backoff_delay(poll_attempt, max_interval)
+                    if wait_count < min_wait_time:
+                        delay = max(delay, min_wait_time - wait_count)
                     remaining_time = max_wait_time - wait_count
-                    progress_percent = min(90, 30 + (wait_count - min_wait_time) * 60 / (max_wait_time - min_wait_time))
-                    print(f"⏳ {data_type.title()} 처리 중... {check_interval}초 후 재확인 (남은 시간: {remaining_time}초)")
-                    if session_id:
-                        from app.services.progress_service import progress_service
-                        progress_service.update_progress(session_id, f"{data_type}_collection", int(progress_percent), 
-                                                       f"{data_type.title()} 데이터 처리 중... ({wait_count}초 경과)")
-                    time.sleep(check_interval)
-                    wait_count += check_interval
+                    progress_percent = min(90, 30 + max(0, wait_count - min_wait_time) * progress_scale)
+                    logger.debug("⏳ %s 처리 중... %.1f초 후 재확인 (남은 시간: %.0f초)", data_type.title(), delay, remaining_time)
+                    if update_progress:
+                        update_progress(session_id, f"{data_type}_collection", int(progress_percent), 
+                                        f"{data_type.title()} 데이터 처리 중... ({wait_count:.0f}초 경과)")
+                    await asyncio.sleep(delay)
+                    wait_count += delay
+                    poll_attempt += 1
                     continue
 
-                if response.status_code == 200:
+                if status_code == 200:
                     # 200 응답일 때는 완료된 데이터가 직접 반환됨
                     try:
-                        result = response.json()
-                        print(f"🔍 {data_type.upper()} 응답 구조: {type(result)}")
+                        result = orjson.loads(response_text)
+                        logger.debug("🔍 %s 응답 구조: %s", data_type.upper(), type(result))
                         
                         if isinstance(result, list):
-                            print(f"✅ {data_type.title()} 데이터 직접 반환 완료: {len(result)}개 항목")
-                            if session_id:
-                                from app.services.progress_service import progress_service
-                                progress_service.update_progress(session_id, f"{data_type}_collection", 100, f"{data_type.title()} 데이터 수집 완료")
+                            logger.info("✅ %s 데이터 직접 반환 완료: %d개 항목", data_type.title(), len(result))
+                            if update_progress:
+                                update_progress(session_id, f"{data_type}_collection", 100, f"{data_type.title()} 데이터 수집 완료")
                             return {"type": "direct_data", "data": result}
                         
                         elif isinstance(result, dict):
-                            print(f"🔍 {data_type.upper()} 응답 키: {list(result.keys())}")
+                            logger.debug("🔍 %s 응답 키: %s", data_type.upper(), list(result))
                             
                             # 프로필 데이터가 직접 딕셔너리로 온 경우 (status 필드 없음)
                             if data_type == "profile" and "account" in result and "followers" in result:
-                                print(f"✅ {data_type.title()} 데이터가 직접 딕셔너리로 반환됨")
-                                if session_id:
-                                    from app.services.progress_service import progress_service
-                                    progress_service.update_progress(session_id, f"{data_type}_collection", 100, f"{data_type.title()} 데이터 수집 완료")
+                                logger.info("✅ %s 데이터가 직접 딕셔너리로 반환됨", data_type.title())
+                                if update_progress:
+                                    update_progress(session_id, f"{data_type}_collection", 100, f"{data_type.title()} 데이터 수집 완료")
                                 return {"type": "direct_data", "data": [result]}  # 리스트로 래핑
                             
                             if "file_urls" in result:
-                                print(f"🔍 file_urls 타입: {type(result['file_urls'])}, 내용: {result['file_urls']}")
+                                logger.debug("🔍 file_urls 타입: %s, 내용: %s", type(result["file_urls"]), result["file_urls"])
                             
                             # status 확인
                             status = result.get("status")
                             if status in ["done", "ready"]:
                                 file_urls = result.get("file_urls", [])
                                 if file_urls:
-                                    print(f"✅ {data_type.title()} 파일 URL로 완료: {len(file_urls)}개 파일")
-                                    if session_id:
-                                        from app.services.progress_service import progress_service
-                                        progress_service.update_progress(session_id, f"{data_type}_collection", 100, f"{data_type.title()} 데이터 수집 완료")
+                                    logger.info("✅ %s 파일 URL로 완료: %d개 파일", data_type.title(), len(file_urls))
+                                    if update_progress:
+                                        update_progress(session_id, f"{data_type}_collection", 100, f"{data_type.title()} 데이터 수집 완료")
                                     return {"type": "file_urls", "urls": file_urls}
                                 else:
                                     # 데이터가 result에 직접 있을 수 있음
                                     if "data" in result or "snapshot" in result:
                                         data_field = result.get("data") or result.get("snapshot")
                                         if data_field:
-                                            print(f"✅ {data_type.title()} 응답에서 직접 데이터 추출")
-                                            if session_id:
-                                                from app.services.progress_service import progress_service
-                                                progress_service.update_progress(session_id, f"{data_type}_collection", 100, f"{data_type.title()} 데이터 수집 완료")
+                                            logger.info("✅ %s 응답에서 직접 데이터 추출", data_type.title())
+                                            if update_progress:
+                                                update_progress(session_id, f"{data_type}_collection", 100, f"{data_type.title()} 데이터 수집 완료")
                                             return {"type": "direct_data", "data": data_field}
                                     
                                     # 기본 다운로드 URL 시도
                                     download_url = f"https://api.brightdata.com/datasets/v3/snapshot/{snapshot_id}?format=json"
-                                    print(f"🔗 {data_type.title()} 기본 다운로드 URL 사용: {download_url}")
-                                    if session_id:
-                                        from app.services.progress_service import progress_service
-                                        progress_service.update_progress(session_id, f"{data_type}_collection", 100, f"{data_type.title()} 데이터 수집 완료")
+                                    logger.info("🔗 %s 기본 다운로드 URL 사용: %s", data_type.title(), download_url)
+                                    if update_progress:
+                                        update_progress(session_id, f"{data_type}_collection", 100, f"{data_type.title()} 데이터 수집 완료")
                                     return {"type": "file_urls", "urls": [download_url]}
                     except Exception as e:
-                        print(f"❌ {data_type.title()} JSON 파싱 오류: {str(e)}")
+                        logger.error("❌ %s JSON 파싱 오류: %s", data_type.title(), e)
                         # raw 텍스트로 처리 시도
-                        text_data = response.text.strip()
+                        text_data = response_text.strip()
                         if text_data:
-                            print(f"🔄 {data_type.title()} 텍스트 데이터로 처리 시도")
+                            logger.info("🔄 %s 텍스트 데이터로 처리 시도", data_type.title())
                             download_url = f"https://api.brightdata.com/datasets/v3/snapshot/{snapshot_id}?format=json"
-                            if session_id:
-                                from app.services.progress_service import progress_service
-                                progress_service.update_progress(session_id, f"{data_type}_collection", 100, f"{data_type.title()} 데이터 수집 완료")
+                            if update_progress:
+                                update_progress(session_id, f"{data_type}_collection", 100, f"{data_type.title()} 데이터 수집 완료")
                             return {"type": "file_urls", "urls": [download_url]}
 
-                print(f"⚠️ {data_type.title()} 예상치 못한 상태 코드: {response.status_code}")
-                time.sleep(check_interval)
-                wait_count += check_interval
-                continue
-
                 # 기타 상태 코드는 계속 대기
-                remaining_time = max_wait_time - wait_count
-                progress_percent = min(90, 30 + (wait_count - min_wait_time) * 60 / (max_wait_time - min_wait_time))
-                print(f"⏳ {data_type.title()} 처리 중... {check_interval}초 후 재확인 (남은 시간: {remaining_time}초)")
-                if session_id:
-                    from app.services.progress_service import progress_service
-                    progress_service.update_progress(session_id, f"{data_type}_collection", int(progress_percent), 
-                                                   f"{data_type.title()} 데이터 처리 중... ({wait_count}초 경과)")
-                time.sleep(check_interval)
-                wait_count += check_interval
+                logger.warning("⚠️ %s 예상치 못한 상태 코드: %s", data_type.title(), status_code)
                 
             except Exception as e:
-                print(f"❌ {data_type.title()} 상태 확인 오류: {e}")
-                time.sleep(check_interval)
-                wait_count += check_interval
+                logger.error("❌ %s 상태 확인 오류: %s", data_type.title(), e)
+            
+            # 예상치 못한 상태 코드/오류가 이어지면 간격을 계속 늘려 실패 중인 API를 반복 호출하지 않음
+            # (오류 뒤 다시 처리 중(202) 응답을 받으면 그때 간격을 처음부터 다시 늘림)
+            delay = _backoff_delay(poll_attempt, max_interval)
+            await asyncio.sleep(delay)
+            wait_count += delay
+            poll_attempt += 1
+            had_error = True
         
         raise Exception(f"{data_type.title()} 스냅샷 타임아웃: {max_wait_time}초 후")
 
-    def download_snapshot_data(self, file_urls):
+    async def _get_snapshot_status(self, snapshot_id, url, params):
+        """스냅샷 상태 조회 (상태 코드, 본문) - 같은 스냅샷의 조회가 진행 중이면 그 결과를 공유
+
+        완료된 조회는 바로 제거하므로 이후 호출은 항상 새 상태를 조회한다.
+        """
+        loop = asyncio.get_running_loop()
+        task = self._status_requests.get(snapshot_id)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(self._fetch_snapshot_status(url, params))
+            self._status_requests[snapshot_id] = task
+            task.add_done_callback(lambda done: self._forget_status_request(snapshot_id, done))
+        # 한 대기자가 취소되어도 공유 중인 조회는 계속 진행
+        return await asyncio.shield(task)
+
+    def _forget_status_request(self, snapshot_id, task):
+        """완료된 상태 조회를 공유 목록에서 제거 (그 사이 새 조회로 교체되었으면 유지)"""
+        if self._status_requests.get(snapshot_id) is task:
+            del self._status_requests[snapshot_id]
+
+    async def _fetch_snapshot_status(self, url, params):
+        async with self._get_session().get(url, params=params) as response:
+            return response.status, await response.text()
+
+    async def download_snapshot_data(self, file_urls):
         """URL 리스트에서 JSON 데이터 다운로드"""
         all_data = []
         
         # URL 유효성 검사 및 필터링
-        valid_urls = []
-        for url in file_urls:
-            if isinstance(url, str) and url.startswith(('http://', 'https://')):
-                valid_urls.append(url)
-            else:
-                print(f"⚠️ 유효하지 않은 URL 건너뛰기: {url} (타입: {type(url)})")
+        valid_urls = [url for url in file_urls if isinstance(url, str) and _is_http_url(url)]
+        if len(valid_urls) != len(file_urls):
+            for url in file_urls:
+                if not (isinstance(url, str) and _is_http_url(url)):
+                    logger.warning("⚠️ 유효하지 않은 URL 건너뛰기: %s (타입: %s)", url, type(url))
         
         if not valid_urls:
-            print("❌ 유효한 URL이 없습니다.")
+            logger.error("❌ 유효한 URL이 없습니다.")
             return all_data
         
-        print(f"📥 {len(valid_urls)}개의 유효한 URL에서 데이터 다운로드 시작")
+        logger.info("📥 %d개의 유효한 URL에서 데이터 다운로드 시작", len(valid_urls))
         
-        # 인증 헤더 설정
-        headers = {"Authorization": f"Bearer {self.api_key}"}
+        # 파일별 다운로드를 동시에 실행하고, 결과는 URL 순서대로 합침
+        semaphore = asyncio.Semaphore(_DOWNLOAD_CONCURRENCY)
+        results = await asyncio.gather(
+            *(self._download_snapshot_file(file_url, semaphore) for file_url in valid_urls)
+        )
+        for file_data in results:
+            all_data.extend(file_data)
         
-        for file_url in valid_urls:
-            try:
-                print(f"⬇️ Downloading from: {file_url}")
-                res = requests.get(file_url, headers=headers, timeout=30)
-                res.raise_for_status()  # HTTP 오류 체크
-                
-                # Content-Type 확인
-                content_type = res.headers.get('Content-Type', '')
-                print(f"📋 Content-Type: {content_type}")
-                
-                if 'application/json' in content_type:
-                    data = res.json()
+        logger.info("✅ 데이터 다운로드 완료: %d개 항목", len(all_data))
+        return all_data
+    
+    async def _download_snapshot_file(self, file_url, semaphore):
+        """스냅샷 파일 하나를 다운로드해 항목 리스트로 반환 (실패 시 그때까지 파싱한 항목만 반환)"""
+        file_data = []
+        try:
+            # 동시 다운로드 수 제한 (BrightData 요청 제한 방지)
+            async with semaphore:
+                logger.debug("⬇️ Downloading from: %s", file_url)
+                # 인증 헤더는 공유 세션에 설정되어 있음
+                async with self._get_session().get(file_url) as res:
+                    res.raise_for_status()  # HTTP 오류 체크
                     
-                    # 🔍 BrightData 응답 요약 로깅
-                    if isinstance(data, list):
-                        print(f"📊 BrightData 리스트 응답: {len(data)}개 항목")
-                        if len(data) > 0 and isinstance(data[0], dict):
-                            print(f"   첫 번째 항목 키들: {list(data[0].keys())}")
-                            # 중요 필드만 로깅
-                            if 'account' in data[0]:
-                                print(f"   Account: {data[0].get('account')}")
-                            if 'followers' in data[0]:
-                                print(f"   Followers: {data[0].get('followers')}")
-                    elif isinstance(data, dict):
-                        print(f"📊 BrightData 딕셔너리 응답: {list(data.keys())}")
-                    else:
-                        print(f"⚠️ 예상치 못한 응답 타입: {type(data)}")
+                    # Content-Type 확인
+                    content_type = res.headers.get('Content-Type', '')
+                    logger.debug("📋 Content-Type: %s", content_type)
                     
-                    if isinstance(data, list):
-                        all_data.extend(data)
-                        print(f"✅ JSON 리스트 데이터 추가: {len(data)}개 항목")
-                    else:
-                        all_data.append(data)
-                        print(f"✅ JSON 객체 데이터 추가: 1개 항목")
-                elif 'text/csv' in content_type or 'text/plain' in content_type:
-                    # CSV 형태 응답 처리
-                    print(f"📊 CSV 응답 감지, CSV 파싱 시작")
-                    csv_data = self._parse_csv_response(res.text)
-                    if csv_data:
-                        all_data.extend(csv_data)
-                        print(f"✅ CSV 데이터 파싱 완료: {len(csv_data)}개 항목")
+                    if not any(kind in content_type for kind in ('application/json', 'text/csv', 'text/plain')):
+                        # JSON이 아닌 경우 JSON Lines로 보고 받는 대로 줄 단위 파싱
+                        # (전체 본문을 문자열과 줄 리스트로 만들지 않음)
+                        line_count = await self._parse_json_lines(res.content, file_data)
+                        logger.debug("✅ JSON Lines 데이터 파싱 완료: %d줄", line_count)
+                        return file_data
+                    
+                    if 'application/json' in content_type:
+                        # JSON은 문자열로 디코딩하지 않고 바이트 그대로 파싱
+                        body = await res.read()
                     else:
-                        print(f"❌ CSV 파싱 실패")
+                        response_text = await res.text()
+            
+            if 'application/json' in content_type:
+                data = orjson.loads(body)
+                
+                # 🔍 BrightData 응답 요약 로깅
+                if isinstance(data, list):
+                    logger.debug("📊 BrightData 리스트 응답: %d개 항목", len(data))
+                    if len(data) > 0 and isinstance(data[0], dict):
+                        logger.debug("   첫 번째 항목 키들: %s", list(data[0]))
+                        # 중요 필드만 로깅
+                        if 'account' in data[0]:
+                            logger.debug("   Account: %s", data[0].get('account'))
+                        if 'followers' in data[0]:
+                            logger.debug("   Followers: %s", data[0].get('followers'))
+                elif isinstance(data, dict):
+                    logger.debug("📊 BrightData 딕셔너리 응답: %s", list(data))
                 else:
-                    # JSON이 아닌 경우 텍스트로 읽어 JSON Lines 파싱 시도
-                    text_data = res.text.strip()
-                    if text_data:
-                        # JSON Lines 형식일 수 있음 (한 줄에 하나씩 JSON)
-                        for line in text_data.split('\n'):
-                            line = line.strip()
-                            if line:
-                                try:
-                                    item = json.loads(line)
-                                    all_data.append(item)
-                                except json.JSONDecodeError:
-                                    continue
-                        print(f"✅ JSON Lines 데이터 파싱 완료: {len(text_data.split())}줄")
-                    
-            except requests.exceptions.RequestException as e:
-                print(f"❌ HTTP 요청 실패 {file_url}: {e}")
-            except ValueError as e:
-                print(f"❌ JSON 파싱 실패 {file_url}: {e}")
-            except Exception as e:
-                print(f"❌ 예상치 못한 오류 {file_url}: {e}")
+                    logger.warning("⚠️ 예상치 못한 응답 타입: %s", type(data))
+                
+                if isinstance(data, list):
+                    file_data.extend(data)
+                    logger.debug("✅ JSON 리스트 데이터 추가: %d개 항목", len(data))
+                else:
+                    file_data.append(data)
+                    logger.debug("✅ JSON 객체 데이터 추가: 1개 항목")
+            else:
+                # CSV 형태 응답 처리
+                logger.debug("📊 CSV 응답 감지, CSV 파싱 시작")
+                csv_data = self._parse_csv_response(response_text)
+                if csv_data:
+                    file_data.extend(csv_data)
+                    logger.debug("✅ CSV 데이터 파싱 완료: %d개 항목", len(csv_data))
+                else:
+                    logger.error("❌ CSV 파싱 실패")
+                
+        except aiohttp.ClientError as e:
+            logger.error("❌ HTTP 요청 실패 %s: %s", file_url, e)
+        except ValueError as e:
+            logger.error("❌ JSON 파싱 실패 %s: %s", file_url, e)
+        except Exception as e:
+            logger.error("❌ 예상치 못한 오류 %s: %s", file_url, e)
         
-        print(f"✅ 데이터 다운로드 완료: {len(all_data)}개 항목")
-        return all_data
+        return file_data
+    
+    @staticmethod
+    async def _parse_json_lines(stream, items):
+        """JSON Lines 응답 스트림을 받는 대로 줄 단위로 파싱해 items에 추가하고 비어 있지 않은 줄 수 반환
+
+        한 줄이 StreamReader의 readline 한도보다 길 수 있으므로 청크를 받아 직접 줄을 나눔.
+        """
+        line_count = 0
+        
+        def parse(line):
+            nonlocal line_count
+            line = line.strip()
+            if not line:
+                return
+            line_count += 1
+            try:
+                items.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
+                pass
+        
+        # 줄바꿈은 새로 받은 청크 범위에서만 찾고, 처리한 줄은 버퍼 앞에서 잘라냄
+        # (누적 버퍼 전체를 청크마다 복사·분할하지 않도록)
+        buffer = bytearray()
+        async for chunk in stream.iter_any():
+            search_from = len(buffer)
+            buffer += chunk
+            start = 0
+            end = buffer.find(b"\n", search_from)
+            while end != -1:
+                parse(buffer[start:end])
+                start = end + 1
+                end = buffer.find(b"\n", start)
+            if start:
+                del buffer[:start]
+        parse(buffer)
+        return line_count
     
     def _parse_csv_response(self, csv_text: str):
         """CSV 응답을 JSON 형태로 변환"""
@@ -312,138 +481,80 @@ class Instagram:
                 
                 csv_data.append(processed_row)
             
-            print(f"📊 CSV 파싱 완료: {len(csv_data)}개 행 처리됨")
+            logger.debug("📊 CSV 파싱 완료: %d개 행 처리됨", len(csv_data))
             if csv_data:
-                print(f"   첫 번째 행 키들: {list(csv_data[0].keys())}")
+                logger.debug("   첫 번째 행 키들: %s", list(csv_data[0]))
                 # 중요 필드 확인
                 first_row = csv_data[0]
                 if 'account' in first_row:
-                    print(f"   Account: {first_row.get('account')}")
+                    logger.debug("   Account: %s", first_row.get('account'))
                 if 'followers' in first_row:
-                    print(f"   Followers: {first_row.get('followers')}")
+                    logger.debug("   Followers: %s", first_row.get('followers'))
             
             return csv_data
             
         except Exception as e:
-            print(f"❌ CSV 파싱 에러: {str(e)}")
+            logger.error("❌ CSV 파싱 에러: %s", e)
             return []
 
-    async def get_reel_data(self, reel_url: str, config: dict) -> dict:
-        """인스타그램 릴스 URL에서 데이터를 수집합니다. (캠페인용)"""
+    # 캠페인 수집 종류별 로그 표기 (이모지, 한글 이름)
+    _COLLECT_LABELS = {
+        "reel": ("🎬", "릴스"),
+        "post": ("📸", "게시물"),
+    }
+
+    async def _collect(self, kind: str, url: str, config: dict) -> list:
+        """캠페인용 릴스/게시물 데이터 수집 공통 로직 (kind: "reel" 또는 "post")"""
+        emoji, label = self._COLLECT_LABELS[kind]
         try:
-            print(f"🎬 릴스 데이터 수집 시작: {reel_url}")
-            
-            # brightdata.json에서 설정 로드
-            import json
-            from pathlib import Path
+            logger.info("%s %s 데이터 수집 시작: %s", emoji, label, url)
             
-            config_path = Path(__file__).parent / "brightdata.json"
-            with open(config_path, 'r', encoding='utf-8') as f:
-                brightdata_config = json.load(f)
-            
-            # 릴스 설정에서 params 가져오기
-            reel_config = brightdata_config.get("instagram", {}).get("reel", {})
-            campaign_params = reel_config.get("params", {}).copy()
-            
-            # 캠페인용으로 type과 discover_by 제거
-            campaign_params.pop("type", None)
-            campaign_params.pop("discover_by", None)
+            # 설정 (brightdata.json은 최초 한 번만 로드)
+            kind_config = _load_brightdata_config().get("instagram", {}).get(kind, {})
+            # 캠페인용 params (type과 discover_by 제거된 템플릿 복사)
+            campaign_params = dict(_campaign_params_template(kind))
             
             # config에서 include_errors 설정 적용
             if "include_errors" in config:
                 campaign_params["include_errors"] = config["include_errors"]
             
-            print(f"캠페인 릴스 설정: {campaign_params}")
+            logger.debug("캠페인 %s 설정: %s", label, campaign_params)
             
-            # 릴스 데이터 수집
-            dataset_id = reel_config.get("dataset_id")
+            dataset_id = kind_config.get("dataset_id")
             if not dataset_id:
-                raise ValueError("reel dataset_id가 설정되지 않았습니다.")
+                raise ValueError(f"{kind} dataset_id가 설정되지 않았습니다.")
             
             # 스냅샷 요청
-            snapshot_id = self.trigger_snapshot_request(
+            snapshot_id = await self.trigger_snapshot_request(
                 dataset_id=dataset_id,
                 params=campaign_params,
-                data={"url": reel_url}
+                data={"url": url}
             )
             
             # 스냅샷 완료 대기
-            result = self.wait_for_snapshot(snapshot_id)
+            result = await self.wait_for_snapshot(snapshot_id)
             
             # 데이터 다운로드
             if result["type"] == "direct_data":
-                reel_data = result["data"]
-                print(f"📊 직접 반환된 릴스 데이터: {len(reel_data)}개 항목")
-                if reel_data and len(reel_data) > 0:
-                    print(f"📋 첫 번째 항목 키: {list(reel_data[0].keys()) if isinstance(reel_data[0], dict) else 'Not a dict'}")
+                data = result["data"]
+                logger.info("📊 직접 반환된 %s 데이터: %d개 항목", label, len(data))
+                if data and len(data) > 0:
+                    logger.debug("📋 첫 번째 항목 키: %s", list(data[0]) if isinstance(data[0], dict) else 'Not a dict')
             else: # result["type"] == "file_urls"
-                file_urls = result["urls"]
-                reel_data = self.download_snapshot_data(file_urls)
-                print(f"📊 파일에서 다운로드된 릴스 데이터: {len(reel_data)}개 항목")
+                data = await self.download_snapshot_data(result["urls"])
+                logger.info("📊 파일에서 다운로드된 %s 데이터: %d개 항목", label, len(data))
             
-            print(f"✅ 릴스 데이터 수집 완료: {reel_url}")
-            return reel_data
+            logger.info("✅ %s 데이터 수집 완료: %s", label, url)
+            return data
             
         except Exception as e:
-            print(f"❌ 릴스 데이터 수집 실패: {str(e)}")
+            logger.error("❌ %s 데이터 수집 실패: %s", label, e)
             raise
 
+    async def get_reel_data(self, reel_url: str, config: dict) -> dict:
+        """인스타그램 릴스 URL에서 데이터를 수집합니다. (캠페인용)"""
+        return await self._collect("reel", reel_url, config)
+
     async def get_post_data(self, post_url: str, config: dict) -> dict:
         """인스타그램 게시물 URL에서 데이터를 수집합니다. (캠페인용)"""
-        try:
-            print(f"📸 게시물 데이터 수집 시작: {post_url}")
-            
-            # brightdata.json에서 설정 로드
-            import json
-            from pathlib import Path
-            
-            config_path = Path(__file__).parent / "brightdata.json"
-            with open(config_path, 'r', encoding='utf-8') as f:
-                brightdata_config = json.load(f)
-            
-            # 게시물 설정에서 params 가져오기
-            post_config = brightdata_config.get("instagram", {}).get("post", {})
-            campaign_params = post_config.get("params", {}).copy()
-            
-            # 캠페인용으로 type과 discover_by 제거
-            campaign_params.pop("type", None)
-            campaign_params.pop("discover_by", None)
-            
-            # config에서 include_errors 설정 적용
-            if "include_errors" in config:
-                campaign_params["include_errors"] = config["include_errors"]
-            
-            print(f"캠페인 게시물 설정: {campaign_params}")
-            
-            # 게시물 데이터 수집
-            dataset_id = post_config.get("dataset_id")
-            if not dataset_id:
-                raise ValueError("post dataset_id가 설정되지 않았습니다.")
-            
-            # 스냅샷 요청
-            snapshot_id = self.trigger_snapshot_request(
-                dataset_id=dataset_id,
-                params=campaign_params,
-                data={"url": post_url}
-            )
-            
-            # 스냅샷 완료 대기
-            result = self.wait_for_snapshot(snapshot_id)
-            
-            # 데이터 다운로드
-            if result["type"] == "direct_data":
-                post_data = result["data"]
-                print(f"📊 직접 반환된 게시물 데이터: {len(post_data)}개 항목")
-                if post_data and len(post_data) > 0:
-                    print(f"📋 첫 번째 항목 키: {list(post_data[0].keys()) if isinstance(post_data[0], dict) else 'Not a dict'}")
-            else: # result["type"] == "file_urls"
-                file_urls = result["urls"]
-                post_data = self.download_snapshot_data(file_urls)
-                print(f"📊 파일에서 다운로드된 게시물 데이터: {len(post_data)}개 항목")
-            
-            print(f"✅ 게시물 데이터 수집 완료: {post_url}")
-            return post_data
-            
-        except Exception as e:
-            print(f"❌ 게시물 데이터 수집 실패: {str(e)}")
-            raise
+        return await self._collect("post", post_url, config)
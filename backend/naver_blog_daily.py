@@ -1,61 +1,68 @@
 """네이버 블로그 일일 방문자 수 수집 모듈"""
 
 import requests
-import json
-from typing import Optional, Dict
-from xml.etree import ElementTree as ET
+import orjson
+from requests.adapters import HTTPAdapter
+from typing import Any, Optional
+from lxml import etree
 
 
-def get_naver_blog_visitors(api_url: str) -> Optional[str]:
+# 방문자 API 호출에 공유하는 세션 (blog.naver.com 연결을 keep-alive로 재사용)
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Referer': 'https://blog.naver.com/',
+    'Accept': 'application/json, text/javascript, */*; q=0.01',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
+    'Accept-Encoding': 'gzip, deflate',
+    'X-Requested-With': 'XMLHttpRequest'
+})
+# blog_service가 스레드 풀에서 동시에 호출하므로 풀 크기를 넉넉히 설정
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# 외부 응답 XML 파서 - 엔티티 확장(XXE, 엔티티 폭탄)과 네트워크 접근을 막음
+_XML_PARSER = etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=False)
+
+
+def get_naver_blog_visitors(api_url: str) -> Optional[Any]:
     """네이버 블로그 방문자 수 API 호출
     
     Args:
         api_url: 네이버 블로그 방문자 API URL
         
     Returns:
-        JSON 문자열 또는 None
+        파싱된 응답 데이터 (XML 응답은 {날짜: 방문자 수} 딕셔너리) 또는 None
     """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Referer': 'https://blog.naver.com/',
-            'Accept': 'application/json, text/javascript, */*; q=0.01',
-            'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
-            'X-Requested-With': 'XMLHttpRequest'
-        }
-        
-        response = requests.get(api_url, headers=headers, timeout=10)
+        response = _SESSION.get(api_url, timeout=10)
         response.raise_for_status()
         
         # 응답이 XML인지 JSON인지 확인
         content_type = response.headers.get('content-type', '').lower()
         
         # XML 응답인 경우 (네이버 블로그 방문자 API는 XML 반환)
-        if 'xml' in content_type or response.text.strip().startswith('<?xml'):
+        if 'xml' in content_type or response.content.lstrip().startswith(b'<?xml'):
             try:
-                # XML을 파싱하여 JSON 형식으로 변환
-                root = ET.fromstring(response.text)
-                visitor_data = {}
+                # XML을 파싱하여 딕셔너리로 변환 (바이트를 그대로 넘겨 XML 선언의 인코딩을 따름)
+                root = etree.fromstring(response.content, parser=_XML_PARSER)
                 
-                # visitorcnt 요소들을 찾아서 날짜별 방문자 수 추출
-                for visitorcnt in root.findall('.//visitorcnt'):
-                    date_id = visitorcnt.get('id')
-                    count = visitorcnt.get('cnt')
-                    if date_id and count:
-                        visitor_data[date_id] = count
+                # visitorcnt 요소들을 찾아서 날짜별 방문자 수 추출 (XPath 없이 트리 순회)
+                visitor_data = {
+                    visitorcnt.get('id'): visitorcnt.get('cnt')
+                    for visitorcnt in root.iter('visitorcnt')
+                    if visitorcnt.get('id') and visitorcnt.get('cnt')
+                }
                 
-                # JSON 문자열로 변환하여 반환
-                return json.dumps(visitor_data)
-            except ET.ParseError as e:
+                return visitor_data
+            except etree.XMLSyntaxError as e:
                 print(f"❌ XML parse error from {api_url}: {str(e)}")
                 print(f"   Response text (first 500 chars): {response.text[:500]}")
                 return None
         
         # JSON 응답인 경우
         try:
-            json.loads(response.text)
-            return response.text
-        except json.JSONDecodeError:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
             print(f"❌ Invalid JSON response from {api_url}")
             print(f"   Response status: {response.status_code}")
             print(f"   Response headers: {dict(response.headers)}")
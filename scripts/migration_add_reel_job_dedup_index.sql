@@ -0,0 +1,8 @@
+-- 스케줄러 '오늘 수집 완료' 확인 (campaign_id, reel_url, status, completed_at) - user_posted가 있는 행만
+-- 운영 중인 DB에서는 쓰기 잠금을 피하기 위해 CONCURRENTLY로 생성
+-- CONCURRENTLY는 트랜잭션 블록 안에서 실행할 수 없으므로 이 파일은 다른 SQL과 묶지 말고 autocommit으로 단독 실행:
+--   psql -h [호스트] -U [사용자명] -d [데이터베이스명] -f scripts/migration_add_reel_job_dedup_index.sql
+-- (psql -1/--single-transaction 옵션이나 run_migration.py처럼 트랜잭션으로 감싸는 실행기는 사용하지 않음)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_campaign_reel_collection_jobs_dedup
+    ON campaign_reel_collection_jobs (campaign_id, reel_url, status, completed_at)
+    WHERE user_posted IS NOT NULL;
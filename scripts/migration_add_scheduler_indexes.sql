@@ -0,0 +1,29 @@
+-- 스케줄러 조회 성능 개선을 위한 인덱스 추가
+-- 신규 테이블은 models.Base.metadata.create_all()에서 자동 생성되지만,
+-- 기존 테이블에는 아래 SQL을 직접 실행해야 합니다.
+
+-- 활성 스케줄 조회 (is_active, start_date, end_date)
+CREATE INDEX IF NOT EXISTS ix_collection_schedules_active_range
+    ON collection_schedules (is_active, start_date, end_date);
+
+-- 오늘 수집 여부 확인 (campaign_id, campaign_url, collection_date)
+CREATE INDEX IF NOT EXISTS ix_campaign_instagram_posts_dedup
+    ON campaign_instagram_posts (campaign_id, campaign_url, collection_date);
+
+CREATE INDEX IF NOT EXISTS ix_campaign_instagram_reels_dedup
+    ON campaign_instagram_reels (campaign_id, campaign_url, collection_date);
+
+CREATE INDEX IF NOT EXISTS ix_campaign_blogs_dedup
+    ON campaign_blogs (campaign_id, campaign_url, collection_date);
+
+-- 캠페인별 릴스 수집 작업 상태 조회 (campaign_id, status)
+CREATE INDEX IF NOT EXISTS ix_campaign_reel_collection_jobs_campaign_status
+    ON campaign_reel_collection_jobs (campaign_id, status);
+
+-- influencer_profiles.username은 unique 제약으로 이미 인덱스가 존재함
+
+-- 스케줄러 '오늘 수집 완료' 확인용 부분 인덱스(ix_campaign_reel_collection_jobs_dedup)는
+-- CONCURRENTLY로 생성해야 하므로 migration_add_reel_job_dedup_index.sql에서 별도로 실행
+
+-- campaign_blogs (campaign_id, campaign_url, collection_date)는 ix_campaign_blogs_dedup으로 이미 커버됨
+-- (B-tree는 역방향 스캔이 가능하므로 collection_date DESC 인덱스를 별도로 만들지 않음)